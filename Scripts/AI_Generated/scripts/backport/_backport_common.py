@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Shared backport steps for the backport scripts.
+
+Each script supplies how to read the dhatu field of an entry and how to
+apply a file's updates; locating the Data files, grouping the entries by
+file, updating the files and reporting the results live here once.
+"""
+
+import os
+import functools
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+
+@functools.lru_cache(maxsize=None)
+def list_kanda_folder(kanda_folder):
+    """
+    List a kanda folder once and reuse it for every entry that targets it.
+
+    Returns: Tuple of (name, is_dir) pairs in directory order
+    """
+    with os.scandir(kanda_folder) as entries:
+        return tuple((entry.name, entry.is_dir()) for entry in entries)
+
+
+# Map kanda names to IDs
+_KANDA_MAP = {
+    'प्रथमकाण्डः': '1',
+    'द्वितीयकाण्डः': '2',
+    'तृतीयकाण्डः': '3'
+}
+
+# Map adhikaar names to file numbers
+_ADHIKAAR_TO_FILE = {
+    'भ्वादिगणः': '1',
+    'अदादिगणः': '2',
+    'जुहोत्यादिगणः': '3',
+    'दिवादिगणः': '4',
+    'स्वादिगणः': '5',
+    'तुदादिगणः': '6',
+    'रुधादिगणः': '7',
+    'तनादिगणः': '8',
+    'क्रयादिगणः': '9',
+    'चुरादिगणः': '10',
+    'नामधातवः': '11',
+    'कण्ड्वादयः': '12'
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _locate_yaml_file(data_folder, kanda_name, varga_name, adhikaar):
+    """
+    Resolve a (kanda, varga, adhikaar) triple once; entries repeat the same few.
+
+    Returns: (yaml_file or None, True if the varga is a skipped नानार्थवर्गः)
+    """
+    kanda_id = _KANDA_MAP.get(kanda_name)
+    if not kanda_id:
+        return None, False
+
+    kanda_folder = os.path.join(data_folder, f"{kanda_id}_{kanda_name}")
+
+    if not os.path.exists(kanda_folder):
+        return None, False
+
+    # Check if this is नानार्थवर्गः (skip these files)
+    if 'नानार्थवर्गः' in varga_name:
+        return None, True
+
+    # If adhikaar is specified, this is a sub-varga file
+    if adhikaar:
+        file_num = _ADHIKAAR_TO_FILE.get(adhikaar)
+        if not file_num:
+            return None, False
+
+        # Try to find the varga folder
+        for item, is_dir in list_kanda_folder(kanda_folder):
+            if varga_name in item and is_dir:
+                varga_folder = os.path.join(kanda_folder, item)
+                yaml_file = os.path.join(varga_folder, f"{file_num}_{adhikaar}.yaml")
+                if os.path.exists(yaml_file):
+                    return yaml_file, False
+                break
+    else:
+        # Regular varga (single YAML file)
+        for item, _ in list_kanda_folder(kanda_folder):
+            if varga_name in item and item.endswith('.yaml'):
+                yaml_file = os.path.join(kanda_folder, item)
+                if os.path.exists(yaml_file):
+                    return yaml_file, False
+
+    return None, False
+
+
+def find_yaml_file(data_folder, kanda_name, varga_name, adhikaar=None):
+    """
+    Find the YAML file path for a given kanda, varga, and optionally adhikaar.
+
+    Returns: Path to the YAML file, or None if not found
+    """
+    yaml_file, skipped = _locate_yaml_file(data_folder, kanda_name, varga_name, adhikaar)
+    if skipped:
+        print(f"  ⏭️  Skipping नानार्थवर्गः: {varga_name}")
+    return yaml_file
+
+
+def build_shloka_index(yaml_data):
+    """
+    Map each stripped shloka key to the key itself, so entries whose
+    shloka_text matches exactly are found without scanning the file.
+    """
+    shloka_index = {}
+    for shloka_key in yaml_data.keys():
+        shloka_index.setdefault(shloka_key.strip(), shloka_key)
+    return shloka_index
+
+
+def backport_entries(changes_data, data_folder, extract_dhatu, apply_file_updates,
+                     unedited=None, quiet=False):
+    """
+    Apply every entry of changes_data to its Data file.
+
+    extract_dhatu(entry_data) returns (label, value) for the dhatu field the
+    script backports, e.g. ('Dhatu IDs', '01.0594, 01.0608').
+    apply_file_updates(yaml_file, entries) updates one file, where each entry
+    is (shloka_text, artha, form, dhatu, gati), and returns True or False per
+    entry; it runs in a worker process when several files are touched.
+    Entries whose dhatu is still unedited are skipped.
+
+    Each entry's progress (quiet=False) and warnings are printed together,
+    in the order of changes_data, once every file has been updated.
+
+    Returns: (updated_count, not_found_count, skipped_count, updated_files)
+    """
+    updated_files = set()
+    updated_count = 0
+    not_found_count = 0
+    skipped_count = 0
+
+    # Lines to report per entry, as (is_warning, text); progress lines are
+    # dropped when quiet
+    reports = []
+
+    # Resolve the target file of every entry first, so that each file is
+    # loaded once, receives all of its updates, and is written once
+    entries_by_file = defaultdict(list)
+    indexes_by_file = defaultdict(list)
+
+    for key, entry_data in changes_data.items():
+        # Extract only the fields needed for backporting
+        # Note: 'resolved' and 'comment' fields are ignored (used only for proofreading workflow)
+        form = entry_data.get('form')
+        label, dhatu = extract_dhatu(entry_data)
+        gati = entry_data.get('gati', '')
+        kanda = entry_data.get('kanda')
+        varga = entry_data.get('varga')
+        adhikaar = entry_data.get('adhikaar', '')
+        artha = entry_data.get('artha')
+        shloka_text = entry_data.get('shloka_text')
+
+        report = [(False, f"Processing: {key}"),
+                  (False, f"  Form: {form}, {label}: {dhatu}, Gati: {gati}")]
+        reports.append(report)
+
+        # Skip if not manually edited yet
+        if unedited is not None and dhatu == unedited:
+            report.append((False, f"  ⏭️  Skipped: dhatu_id still '{unedited}' (not edited yet)"))
+            skipped_count += 1
+            continue
+
+        # Find the YAML file
+        yaml_file, nanartha = _locate_yaml_file(data_folder, kanda, varga, adhikaar if adhikaar else None)
+        if nanartha:
+            report.append((True, f"  ⏭️  Skipping नानार्थवर्गः: {varga}"))
+
+        if not yaml_file:
+            report.append((True, f"  ❌ YAML file not found for: {kanda} / {varga} / {adhikaar}"))
+            not_found_count += 1
+            continue
+
+        report.append((False, f"  📁 Found: {yaml_file}"))
+        entries_by_file[yaml_file].append((shloka_text, artha, form, dhatu, gati))
+        indexes_by_file[yaml_file].append(len(reports) - 1)
+
+    # Each data file is independent, so update them on all cores. A single
+    # file (the usual per-part backport) is not worth starting a pool for
+    yaml_files = list(entries_by_file)
+    if len(yaml_files) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(yaml_files), os.cpu_count())) as executor:
+            file_results = list(executor.map(apply_file_updates, yaml_files,
+                                             entries_by_file.values()))
+    else:
+        file_results = [apply_file_updates(yaml_file, entries)
+                        for yaml_file, entries in entries_by_file.items()]
+
+    for yaml_file, results in zip(yaml_files, file_results):
+        entries = entries_by_file[yaml_file]
+        for index, (shloka_text, artha, form, dhatu, gati), updated in zip(
+                indexes_by_file[yaml_file], entries, results):
+            if updated:
+                updated_count += 1
+                reports[index].append((False, f"  ✅ Updated: {form} → {dhatu}"))
+            else:
+                reports[index].append((True, f"  ⚠️  Verb not found in YAML: {form} in artha '{artha}'"))
+                not_found_count += 1
+
+        if any(results):
+            updated_files.add(yaml_file)
+
+    for report in reports:
+        for is_warning, text in report:
+            if is_warning or not quiet:
+                print(text)
+        if not quiet:
+            print()
+
+    return updated_count, not_found_count, skipped_count, updated_files
@@ -26,35 +26,15 @@ This script:
 import yaml
 import sys
 import os
-from collections import OrderedDict
+from pathlib import Path
 
-# Custom YAML dumper to preserve strings and formatting
-class QuotedDumper(yaml.SafeDumper):
-    pass
+# The shared YAML helpers live in Scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from _yaml_fast import ForceStringLoader, QuotedDumper
 
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
-
-def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
-
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=QuotedDumper)
-
-
-# Custom loader to force all scalars to strings and preserve order
-class ForceStringLoader(yaml.SafeLoader):
-    pass
-
-def str_constructor(loader, node):
-    return loader.construct_scalar(node)
-
-def dict_constructor(loader, node):
-    return OrderedDict(loader.construct_pairs(node))
-
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:map', dict_constructor)
+# Steps shared by both backport scripts; find_yaml_file is also used by the
+# verification script and the backport test through this module
+from _backport_common import backport_entries, build_shloka_index, find_yaml_file
 
 
 def load_not_found_dhatu_ids(yaml_file):
@@ -63,110 +43,66 @@ def load_not_found_dhatu_ids(yaml_file):
         return yaml.load(f, Loader=ForceStringLoader)
 
 
-def find_yaml_file(data_folder, kanda_name, varga_name, adhikaar=None):
+def update_verb_in_shloka(yaml_data, shloka_key, artha, form, new_dhatu_id, gati):
     """
-    Find the YAML file path for a given kanda, varga, and optionally adhikaar.
+    Update a verb's dhatu_id under one shloka.
+    Changes from null to [dhatu_id] or [gati, dhatu_id]
 
-    Returns: Path to the YAML file, or None if not found
+    Returns: True if updated, False if the artha/form is not under this shloka
     """
-    # Map kanda names to IDs
-    kanda_map = {
-        'प्रथमकाण्डः': '1',
-        'द्वितीयकाण्डः': '2',
-        'तृतीयकाण्डः': '3'
-    }
-
-    kanda_id = kanda_map.get(kanda_name)
-    if not kanda_id:
-        return None
-
-    kanda_folder = os.path.join(data_folder, f"{kanda_id}_{kanda_name}")
-
-    if not os.path.exists(kanda_folder):
-        return None
-
-    # Check if this is नानार्थवर्गः (skip these files)
-    if 'नानार्थवर्गः' in varga_name:
-        print(f"  ⏭️  Skipping नानार्थवर्गः: {varga_name}")
-        return None
-
-    # If adhikaar is specified, this is a sub-varga file
-    if adhikaar:
-        # Map adhikaar names to file numbers
-        adhikaar_to_file = {
-            'भ्वादिगणः': '1',
-            'अदादिगणः': '2',
-            'जुहोत्यादिगणः': '3',
-            'दिवादिगणः': '4',
-            'स्वादिगणः': '5',
-            'तुदादिगणः': '6',
-            'रुधादिगणः': '7',
-            'तनादिगणः': '8',
-            'क्रयादिगणः': '9',
-            'चुरादिगणः': '10',
-            'नामधातवः': '11',
-            'कण्ड्वादयः': '12'
-        }
-
-        file_num = adhikaar_to_file.get(adhikaar)
-        if not file_num:
-            return None
-
-        # Try to find the varga folder
-        for item in os.listdir(kanda_folder):
-            if varga_name in item and os.path.isdir(os.path.join(kanda_folder, item)):
-                varga_folder = os.path.join(kanda_folder, item)
-                yaml_file = os.path.join(varga_folder, f"{file_num}_{adhikaar}.yaml")
-                if os.path.exists(yaml_file):
-                    return yaml_file
-                break
-    else:
-        # Regular varga (single YAML file)
-        for item in os.listdir(kanda_folder):
-            if varga_name in item and item.endswith('.yaml'):
-                yaml_file = os.path.join(kanda_folder, item)
-                if os.path.exists(yaml_file):
-                    return yaml_file
+    shloka_data = yaml_data[shloka_key]
+
+    if not shloka_data or not isinstance(shloka_data, dict):
+        return False
+
+    # Find the artha
+    if artha not in shloka_data:
+        return False
 
-    return None
+    artha_data = shloka_data[artha]
 
+    if not isinstance(artha_data, dict):
+        return False
 
-def update_verb_in_yaml(yaml_data, shloka_text, artha, form, new_dhatu_id, gati):
+    # Find the verb form
+    if form not in artha_data:
+        return False
+
+    # Update the dhatu_id (only if Not Found was replaced with actual ID)
+    if new_dhatu_id and new_dhatu_id != "Not Found":
+        if gati and gati.strip():
+            # Has gati: format is [gati, dhatu_id]
+            yaml_data[shloka_key][artha][form] = [gati, new_dhatu_id]
+        else:
+            # No gati: format is [dhatu_id]
+            yaml_data[shloka_key][artha][form] = [new_dhatu_id]
+        return True
+
+    return False
+
+
+def update_verb_in_yaml(yaml_data, shloka_text, artha, form, new_dhatu_id, gati, shloka_index=None):
     """
     Update a specific verb's dhatu_id in the YAML data structure.
     Changes from null to [dhatu_id] or [gati, dhatu_id]
 
+    shloka_index (from build_shloka_index) is tried first; the substring
+    scan over all shloka keys is only the fallback.
+
     Returns: True if updated, False if not found
     """
-    # Find the shloka
+    # Exact shloka match
+    if shloka_index is not None:
+        shloka_key = shloka_index.get(shloka_text.strip())
+        if shloka_key is not None and update_verb_in_shloka(
+                yaml_data, shloka_key, artha, form, new_dhatu_id, gati):
+            return True
+
+    # Find the shloka by substring match
     for shloka_key in yaml_data.keys():
         if shloka_text.strip() in shloka_key or shloka_key.strip() in shloka_text:
-            shloka_data = yaml_data[shloka_key]
-
-            if not shloka_data or not isinstance(shloka_data, dict):
-                continue
-
-            # Find the artha
-            if artha in shloka_data:
-                artha_data = shloka_data[artha]
-
-                if not isinstance(artha_data, dict):
-                    continue
-
-                # Find the verb form
-                if form in artha_data:
-                    # Check if it's currently null (Not Found)
-                    current_value = artha_data[form]
-
-                    # Update the dhatu_id (only if Not Found was replaced with actual ID)
-                    if new_dhatu_id and new_dhatu_id != "Not Found":
-                        if gati and gati.strip():
-                            # Has gati: format is [gati, dhatu_id]
-                            yaml_data[shloka_key][artha][form] = [gati, new_dhatu_id]
-                        else:
-                            # No gati: format is [dhatu_id]
-                            yaml_data[shloka_key][artha][form] = [new_dhatu_id]
-                        return True
+            if update_verb_in_shloka(yaml_data, shloka_key, artha, form, new_dhatu_id, gati):
+                return True
 
     return False
 
@@ -186,9 +122,37 @@ def write_yaml_file(yaml_file, data):
         )
 
 
-def backport_changes(not_found_yaml, data_folder):
+def apply_file_updates(yaml_file, entries):
+    """
+    Load one data file, apply all of its entry updates and write it back once.
+
+    Runs in a worker process, so it only returns plain data for the caller to report.
+
+    Returns: List with True for each entry that was updated
+    """
+    with open(yaml_file, 'r', encoding='utf-8') as f:
+        yaml_data = yaml.load(f, Loader=ForceStringLoader)
+
+    shloka_index = build_shloka_index(yaml_data)
+    results = [update_verb_in_yaml(yaml_data, *entry, shloka_index) for entry in entries]
+
+    if any(results):
+        # Write the updated YAML back to file
+        write_yaml_file(yaml_file, yaml_data)
+
+    return results
+
+
+def extract_dhatu(entry_data):
+    """The dhatu_id field to backport, with its label for progress lines"""
+    return 'Dhatu ID', entry_data.get('dhatu_id')
+
+
+def backport_changes(not_found_yaml, data_folder, quiet=False):
     """
     Backport changes from not_found_dhatu_ids.yaml to original YAML files.
+
+    quiet: Only print warnings and the summary, not per-entry progress
     """
     print(f"📚 Loading not found dhatu_ids from {not_found_yaml}...")
     changes_data = load_not_found_dhatu_ids(not_found_yaml)
@@ -198,64 +162,13 @@ def backport_changes(not_found_yaml, data_folder):
         return
 
     total_entries = len(changes_data)
-    updated_files = set()
-    updated_count = 0
-    not_found_count = 0
-    skipped_count = 0
 
     print(f"\n{'='*60}")
     print(f"Processing {total_entries} entries...")
     print(f"{'='*60}\n")
 
-    for key, entry_data in changes_data.items():
-        # Extract only the fields needed for backporting
-        # Note: 'resolved' and 'comment' fields are ignored (used only for proofreading workflow)
-        form = entry_data.get('form')
-        dhatu_id = entry_data.get('dhatu_id')
-        gati = entry_data.get('gati', '')
-        kanda = entry_data.get('kanda')
-        varga = entry_data.get('varga')
-        adhikaar = entry_data.get('adhikaar', '')
-        artha = entry_data.get('artha')
-        shloka_text = entry_data.get('shloka_text')
-
-        print(f"Processing: {key}")
-        print(f"  Form: {form}, Dhatu ID: {dhatu_id}, Gati: {gati}")
-
-        # Skip if still "Not Found" (not manually edited yet)
-        if dhatu_id == "Not Found":
-            print(f"  ⏭️  Skipped: dhatu_id still 'Not Found' (not edited yet)")
-            skipped_count += 1
-            print()
-            continue
-
-        # Find the YAML file
-        yaml_file = find_yaml_file(data_folder, kanda, varga, adhikaar if adhikaar else None)
-
-        if not yaml_file:
-            print(f"  ❌ YAML file not found for: {kanda} / {varga} / {adhikaar}")
-            not_found_count += 1
-            print()
-            continue
-
-        print(f"  📁 Found: {yaml_file}")
-
-        # Load the YAML file
-        with open(yaml_file, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.load(f, Loader=ForceStringLoader)
-
-        # Update the verb in the YAML data
-        if update_verb_in_yaml(yaml_data, shloka_text, artha, form, dhatu_id, gati):
-            # Write the updated YAML back to file
-            write_yaml_file(yaml_file, yaml_data)
-            updated_files.add(yaml_file)
-            updated_count += 1
-            print(f"  ✅ Updated: {form} → {dhatu_id}")
-        else:
-            print(f"  ⚠️  Verb not found in YAML: {form} in artha '{artha}'")
-            not_found_count += 1
-
-        print()
+    updated_count, not_found_count, skipped_count, updated_files = backport_entries(
+        changes_data, data_folder, extract_dhatu, apply_file_updates, unedited="Not Found", quiet=quiet)
 
     print(f"\n{'='*60}")
     print(f"✅ Backport complete!")
@@ -273,8 +186,11 @@ def backport_changes(not_found_yaml, data_folder):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python3 Scripts/AI_Generated/scripts/backportNotFoundDhatuIds.py <yaml_file_or_dir> <data_folder>")
+    args = [arg for arg in sys.argv[1:] if arg != '--quiet']
+    quiet = len(args) != len(sys.argv) - 1
+
+    if len(args) != 2:
+        print("Usage: python3 Scripts/AI_Generated/scripts/backportNotFoundDhatuIds.py <yaml_file_or_dir> <data_folder> [--quiet]")
         print("\nOptions:")
         print("  1. Process all YAML files in output directory (recommended):")
         print("     python3 Scripts/AI_Generated/scripts/backportNotFoundDhatuIds.py \\")
@@ -285,10 +201,11 @@ if __name__ == "__main__":
         print("         Scripts/AI_Generated/output/not_found_dhatu_ids_without_gati.yaml \\")
         print("         Data")
         print("\nNote: This will process both *_without_gati.yaml and *_with_gati.yaml files when given a directory")
+        print("\n  --quiet: Only print warnings and summaries, not per-entry progress")
         sys.exit(1)
 
-    yaml_input = sys.argv[1]
-    data_folder = sys.argv[2]
+    yaml_input = args[0]
+    data_folder = args[1]
 
     if not os.path.exists(data_folder):
         print(f"❌ Error: Data folder not found: {data_folder}")
@@ -300,10 +217,13 @@ if __name__ == "__main__":
     if os.path.isdir(yaml_input):
         # Process all relevant YAML files in the directory
         print(f"📂 Processing directory: {yaml_input}")
-        for filename in os.listdir(yaml_input):
-            # Support both old naming (not_found_dhatu_ids_*.yaml) and new split naming (part_*.yaml)
-            if (filename.startswith("not_found_dhatu_ids_") or filename.startswith("part_")) and filename.endswith(".yaml"):
-                yaml_files.append(os.path.join(yaml_input, filename))
+        # Support both old naming (not_found_dhatu_ids_*.yaml) and new split naming (part_*.yaml)
+        input_dir = Path(yaml_input)
+        yaml_files = sorted(
+            str(path)
+            for pattern in ("not_found_dhatu_ids_*.yaml", "part_*.yaml")
+            for path in input_dir.glob(pattern)
+        )
 
         if not yaml_files:
             print(f"❌ Error: No not_found_dhatu_ids_*.yaml or part_*.yaml files found in {yaml_input}")
@@ -326,7 +246,7 @@ if __name__ == "__main__":
         print(f"\n{'='*70}")
         print(f"Processing file {i}/{len(yaml_files)}: {os.path.basename(yaml_file)}")
         print(f"{'='*70}")
-        backport_changes(yaml_file, data_folder)
+        backport_changes(yaml_file, data_folder, quiet)
 
     if len(yaml_files) > 1:
         print(f"\n{'='*70}")
@@ -8,75 +8,45 @@ This script:
 3. These fields are for proofreading workflow only (not backported)
 """
 
-import yaml
 import os
 import sys
-from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
-# Custom YAML dumper and loader
-class QuotedDumper(yaml.SafeDumper):
-    pass
+# The shared YAML helpers live in Scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from _yaml_fast import WRITE_BUFFER_SIZE, dump_entries, load_entries_with_header
 
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
 
-def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
-
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=QuotedDumper)
-
-class ForceStringLoader(yaml.SafeLoader):
-    pass
-
-def str_constructor(loader, node):
-    return loader.construct_scalar(node)
-
-def dict_constructor(loader, node):
-    return OrderedDict(loader.construct_pairs(node))
+def write_yaml_with_header(yaml_file, data, header_lines):
+    """Write YAML data to file with header"""
+    # One large buffer so the header and body reach the OS in a few writes
+    with open(yaml_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        # Write header
+        f.write(''.join(f"{line}\n" for line in header_lines) + "\n")
 
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:map', dict_constructor)
+        # Write YAML data
+        dump_entries(f, data)
 
 
-def load_yaml_file(yaml_file):
-    """Load a YAML file"""
-    with open(yaml_file, 'r', encoding='utf-8') as f:
-        return yaml.load(f, Loader=ForceStringLoader)
+def add_review_fields_to_file(part_path):
+    """
+    Add resolved and comment fields to all entries in a single part file.
 
+    Returns: Number of entries in the file
+    """
+    # Read header and data in one pass over the file
+    header_lines, data = load_entries_with_header(part_path)
 
-def read_header_lines(yaml_file):
-    """Read header comment lines from YAML file"""
-    header_lines = []
-    with open(yaml_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.startswith('#'):
-                header_lines.append(line.rstrip())
-            elif line.strip():  # Stop at first non-comment, non-empty line
-                break
-    return header_lines
+    # Add resolved and comment fields to each entry
+    for key, entry in data.items():
+        if isinstance(entry, dict):
+            # Add resolved and comment fields if not present
+            entry.setdefault('resolved', 'false')
+            entry.setdefault('comment', '')
 
-
-def write_yaml_with_header(yaml_file, data, header_lines):
-    """Write YAML data to file with header"""
-    with open(yaml_file, 'w', encoding='utf-8') as f:
-        # Write header
-        for line in header_lines:
-            f.write(f"{line}\n")
-        f.write("\n")
-
-        # Write YAML data
-        yaml.dump(
-            data,
-            f,
-            allow_unicode=True,
-            default_flow_style=False,
-            indent=2,
-            sort_keys=False,
-            width=1000,
-            Dumper=QuotedDumper
-        )
+    # Write updated file
+    write_yaml_with_header(part_path, data, header_lines)
+    return len(data)
 
 
 def add_review_fields_to_folder(folder_path):
@@ -85,36 +55,20 @@ def add_review_fields_to_folder(folder_path):
     print(f"Processing: {os.path.basename(folder_path)}")
     print(f"{'='*70}\n")
 
-    part_files = sorted([f for f in os.listdir(folder_path)
-                         if f.startswith('part_') and f.endswith('.yaml')])
-
-    total_entries = 0
-
-    for part_file in part_files:
-        part_path = os.path.join(folder_path, part_file)
-
-        # Read header
-        header_lines = read_header_lines(part_path)
-
-        # Load data
-        data = load_yaml_file(part_path)
+    with os.scandir(folder_path) as entries:
+        part_files = sorted(entry.name for entry in entries
+                            if entry.name.startswith('part_') and entry.name.endswith('.yaml'))
+    part_paths = [os.path.join(folder_path, f) for f in part_files]
 
-        # Add resolved and comment fields to each entry
-        for key, entry in data.items():
-            if isinstance(entry, dict):
-                # Add resolved field if not present
-                if 'resolved' not in entry:
-                    entry['resolved'] = 'false'
+    # Each part file is independent, so parse/dump them on all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        entry_counts = list(executor.map(add_review_fields_to_file, part_paths))
 
-                # Add comment field if not present
-                if 'comment' not in entry:
-                    entry['comment'] = ''
-
-        # Write updated file
-        write_yaml_with_header(part_path, data, header_lines)
+    total_entries = 0
 
-        total_entries += len(data)
-        print(f"  ✅ Updated {part_file}: {len(data)} entries")
+    for part_file, entry_count in zip(part_files, entry_counts):
+        total_entries += entry_count
+        print(f"  ✅ Updated {part_file}: {entry_count} entries")
 
     print(f"\n  Total entries updated: {total_entries}")
     print(f"  Total files: {len(part_files)}")
@@ -12,152 +12,246 @@ This script:
 
 import yaml
 import os
+import re
 import sys
-from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
-# Custom YAML dumper and loader
-class QuotedDumper(yaml.SafeDumper):
-    pass
+# The shared YAML helpers live in Scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from _yaml_fast import (
+    DUMP_WIDTH, MAX_SIMPLE_KEY_LENGTH, WRITE_BUFFER_SIZE,
+    ForceStringLoader, dump_entries, split_header,
+)
 
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
+def update_header_entry_count(header_lines, new_count):
+    """Update the ENTRIES TO CORRECT count in header"""
+    count_line = f"# ENTRIES TO CORRECT: {new_count}"
+    return [count_line if 'ENTRIES TO CORRECT:' in line else line
+            for line in header_lines]
 
-def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
 
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=QuotedDumper)
+def write_yaml_with_header(yaml_file, data, header_lines):
+    """Write YAML data to file with header"""
+    # One large buffer so the header and body reach the OS in a few writes
+    with open(yaml_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        # Write header
+        f.write(''.join(f"{line}\n" for line in header_lines) + "\n")
 
-class ForceStringLoader(yaml.SafeLoader):
-    pass
+        # Write YAML data
+        dump_entries(f, data)
 
-def str_constructor(loader, node):
-    return loader.construct_scalar(node)
 
-def dict_constructor(loader, node):
-    return OrderedDict(loader.construct_pairs(node))
+# Any header line carrying the entry count
+_ENTRIES_LINE_RE = re.compile(r'^.*ENTRIES TO CORRECT:.*$', re.MULTILINE)
 
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:map', dict_constructor)
 
+def write_text_with_header(yaml_file, body_text, header_lines, new_count):
+    """Write already formatted YAML text to file with header and updated count"""
+    header_text = ''.join(f"{line}\n" for line in header_lines) + "\n"
+    header_text = _ENTRIES_LINE_RE.sub(f"# ENTRIES TO CORRECT: {new_count}", header_text)
 
-def load_yaml_file(yaml_file):
-    """Load a YAML file"""
-    with open(yaml_file, 'r', encoding='utf-8') as f:
-        return yaml.load(f, Loader=ForceStringLoader)
+    with open(yaml_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(header_text + body_text)
 
 
-def read_header_lines(yaml_file):
-    """Read header comment lines from YAML file"""
-    header_lines = []
-    with open(yaml_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.startswith('#'):
-                header_lines.append(line.rstrip())
-            elif line.strip():  # Stop at first non-comment, non-empty line
-                break
-    return header_lines
+# One entry block exactly as format_flat_entries writes it: a quoted key line
+# followed by its indented, quoted field lines (empty keys are written as "? key")
+_ENTRY_BLOCK_RE = re.compile(r'"([^"\\\n]+)":\n(?:  "[^"\\\n]+": "[^"\\\n]*"\n)+')
+_FIELD_NAME_RE = re.compile(r'^  "([^"\\\n]+)":', re.MULTILINE)
 
+# Every character of such a body is either structure or written verbatim
+_FLAT_BODY_RE = re.compile(
+    r'[\n\x20-\x5B\x5D-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFEFE\uFF00-\uFFFD]*\Z'
+)
+_LONG_LINE_RE = re.compile(r'[^\n]{%d}' % DUMP_WIDTH)
 
-def update_header_entry_count(header_lines, new_count):
-    """Update the ENTRIES TO CORRECT count in header"""
-    updated_header = []
-    for line in header_lines:
-        if 'ENTRIES TO CORRECT:' in line:
-            # Replace the number
-            updated_header.append(f"# ENTRIES TO CORRECT: {new_count}")
+_RESOLVED_LINE = '\n  "resolved": "true"\n'
+
+
+def filter_resolved_lines(body):
+    """
+    Drop resolved entries from part-file text without a YAML round trip.
+
+    Only the flat layout QuotedDumper writes is handled; kept entries are
+    copied verbatim, which is byte-identical to re-dumping them. The scan
+    works on whole entry blocks with compiled regexes rather than per line.
+
+    Returns: (original_count, kept_text, resolved_entries), or None if the
+    text has any other shape (hand-edited quoting, escapes, nesting, ...)
+    """
+    text = body.rstrip('\n') + '\n'
+    if not _FLAT_BODY_RE.match(text) or _LONG_LINE_RE.search(text):
+        return None
+
+    # Steady state: nothing marked resolved, so only the entry count is needed
+    has_resolved = _RESOLVED_LINE in text
+
+    keys = set()
+    kept_blocks = []
+    resolved_entries = []
+    pos = 0
+
+    while pos < len(text):
+        match = _ENTRY_BLOCK_RE.match(text, pos)
+        if not match:
+            return None
+        pos = match.end()
+
+        key = match.group(1)
+        if key in keys or len(key) > MAX_SIMPLE_KEY_LENGTH:
+            return None
+        keys.add(key)
+
+        block = match.group(0)
+        field_names = _FIELD_NAME_RE.findall(block)
+        if (len(set(field_names)) != len(field_names)
+                or max(map(len, field_names)) > MAX_SIMPLE_KEY_LENGTH):
+            return None
+
+        if not has_resolved:
+            continue
+        if _RESOLVED_LINE in block:
+            resolved_entries.append(key)
         else:
-            updated_header.append(line)
-    return updated_header
+            kept_blocks.append(block)
 
+    if not has_resolved:
+        return len(keys), text, resolved_entries
 
-def write_yaml_with_header(yaml_file, data, header_lines):
-    """Write YAML data to file with header"""
-    with open(yaml_file, 'w', encoding='utf-8') as f:
-        # Write header
-        for line in header_lines:
-            f.write(f"{line}\n")
-        f.write("\n")
+    if not kept_blocks:
+        # An empty mapping is dumped as "{}"; leave that to yaml.dump
+        return None
+
+    return len(keys), ''.join(kept_blocks), resolved_entries
+
+
+# A proofreader may type the flag unquoted, which loads as a boolean
+_RESOLVED_VALUES = ('true', True)
+
+
+def remove_resolved_from_file(part_path, dry_run=False):
+    """
+    Remove resolved entries from a single part file.
+
+    Runs in a worker process, so it only returns plain data for the caller to report.
+
+    Returns: (original_count, new_count, resolved_entries)
+    """
+    with open(part_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    header_lines, body = split_header(content)
+
+    # Files in the layout we write are filtered line by line, without YAML
+    filtered = filter_resolved_lines(body)
+    if filtered is not None:
+        original_count, kept_text, resolved_entries = filtered
+        new_count = original_count - len(resolved_entries)
+
+        if resolved_entries and not dry_run:
+            write_text_with_header(part_path, kept_text, header_lines, new_count)
+
+        return original_count, new_count, resolved_entries
+
+    data = yaml.load(body, Loader=ForceStringLoader)
+    original_count = len(data)
+
+    # Filter out resolved entries
+    unresolved_data = {}
+    resolved_entries = []
+
+    # Only hand-edited files reach this path, so entries may not be mappings
+    for key, entry in data.items():
+        if isinstance(entry, dict):
+            # Check if resolved is true (handle both string and boolean)
+            if entry.get('resolved') in _RESOLVED_VALUES:
+                resolved_entries.append(key)
+            else:
+                unresolved_data[key] = entry
+
+    new_count = len(unresolved_data)
+
+    if resolved_entries and not dry_run:
+        # Update header with new count
+        updated_header = update_header_entry_count(header_lines, new_count)
+
+        # Write updated file
+        write_yaml_with_header(part_path, unresolved_data, updated_header)
+
+    return original_count, new_count, resolved_entries
+
+
+def submit_folder(executor, folder_path, dry_run=False):
+    """
+    Queue every part file of a folder on the executor.
+
+    Returns: (part_files, results) where results yields each file's
+    remove_resolved_from_file result in part_files order
+    """
+    # Keep the DirEntry objects, which already carry each file's full path
+    with os.scandir(folder_path) as entries:
+        part_entries = sorted((entry for entry in entries
+                               if entry.name.startswith('part_') and entry.name.endswith('.yaml')),
+                              key=lambda entry: entry.name)
+    part_files = [entry.name for entry in part_entries]
+    part_paths = [entry.path for entry in part_entries]
+
+    results = executor.map(remove_resolved_from_file, part_paths, [dry_run] * len(part_paths))
+    return part_files, results
+
+
+def remove_resolved_from_folder(folder_path, dry_run=False, submitted=None, quiet=False):
+    """
+    Remove resolved entries from all files in a folder
+
+    submitted: Optional (part_files, results) from submit_folder, when the
+    caller has already queued this folder on a shared executor
+    quiet: Only print the folder summary, not per-file details
+    """
+    def log(*args):
+        # Per-file details; the summary always prints
+        if not quiet:
+            print(*args)
 
-        # Write YAML data
-        yaml.dump(
-            data,
-            f,
-            allow_unicode=True,
-            default_flow_style=False,
-            indent=2,
-            sort_keys=False,
-            width=1000,
-            Dumper=QuotedDumper
-        )
-
-
-def remove_resolved_from_folder(folder_path, dry_run=False):
-    """Remove resolved entries from all files in a folder"""
     print(f"\n{'='*70}")
     print(f"Processing: {os.path.basename(folder_path)}")
     print(f"{'='*70}\n")
 
-    part_files = sorted([f for f in os.listdir(folder_path)
-                         if f.startswith('part_') and f.endswith('.yaml')])
+    if submitted is None:
+        # Each part file is independent, so parse/dump them on all cores
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            part_files, results = submit_folder(executor, folder_path, dry_run)
+            results = list(results)
+    else:
+        part_files, results = submitted
 
     total_before = 0
     total_after = 0
     total_removed = 0
     files_with_changes = 0
 
-    for part_file in part_files:
-        part_path = os.path.join(folder_path, part_file)
-
-        # Read header
-        header_lines = read_header_lines(part_path)
-
-        # Load data
-        data = load_yaml_file(part_path)
-        original_count = len(data)
-        total_before += original_count
-
-        # Filter out resolved entries
-        unresolved_data = OrderedDict()
-        resolved_entries = []
-
-        for key, entry in data.items():
-            if isinstance(entry, dict):
-                resolved_value = entry.get('resolved', 'false')
-                # Check if resolved is true (handle both string and boolean)
-                if resolved_value == 'true' or resolved_value == True:
-                    resolved_entries.append(key)
-                else:
-                    unresolved_data[key] = entry
-
+    for part_file, (original_count, new_count, resolved_entries) in zip(part_files, results):
         removed_count = len(resolved_entries)
-        new_count = len(unresolved_data)
+        total_before += original_count
         total_after += new_count
         total_removed += removed_count
 
         if removed_count > 0:
             files_with_changes += 1
-            print(f"  📝 {part_file}:")
-            print(f"     Before: {original_count} entries")
-            print(f"     After:  {new_count} entries")
-            print(f"     Removed: {removed_count} resolved entries")
+            log(f"  📝 {part_file}:")
+            log(f"     Before: {original_count} entries")
+            log(f"     After:  {new_count} entries")
+            log(f"     Removed: {removed_count} resolved entries")
 
             if not dry_run:
-                # Update header with new count
-                updated_header = update_header_entry_count(header_lines, new_count)
-
-                # Write updated file
-                write_yaml_with_header(part_path, unresolved_data, updated_header)
-                print(f"     ✅ File updated")
+                log(f"     ✅ File updated")
             else:
-                print(f"     🔍 [DRY RUN] Would remove:")
+                log(f"     🔍 [DRY RUN] Would remove:")
                 for entry in resolved_entries[:3]:  # Show first 3
-                    print(f"        - {entry}")
+                    log(f"        - {entry}")
                 if len(resolved_entries) > 3:
-                    print(f"        ... and {len(resolved_entries) - 3} more")
+                    log(f"        ... and {len(resolved_entries) - 3} more")
         else:
-            print(f"  ⏭️  {part_file}: No resolved entries")
+            log(f"  ⏭️  {part_file}: No resolved entries")
 
     print(f"\n{'='*70}")
     print(f"Summary for {os.path.basename(folder_path)}:")
@@ -173,6 +267,7 @@ def remove_resolved_from_folder(folder_path, dry_run=False):
 def main():
     """Main function"""
     dry_run = '--dry-run' in sys.argv or '-n' in sys.argv
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
 
     print("\n" + "="*70)
     if dry_run:
@@ -192,15 +287,22 @@ def main():
     grand_total_after = 0
     grand_total_removed = 0
 
-    for folder_path in folders:
-        if not os.path.exists(folder_path):
-            print(f"\n❌ Error: Folder not found: {folder_path}")
-            continue
-
-        before, after, removed = remove_resolved_from_folder(folder_path, dry_run)
-        grand_total_before += before
-        grand_total_after += after
-        grand_total_removed += removed
+    # Queue the part files of all folders on one pool up front, so work on
+    # later folders overlaps with reporting on earlier ones
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        submitted = {folder_path: submit_folder(executor, folder_path, dry_run)
+                     for folder_path in folders if os.path.exists(folder_path)}
+
+        for folder_path in folders:
+            if folder_path not in submitted:
+                print(f"\n❌ Error: Folder not found: {folder_path}")
+                continue
+
+            before, after, removed = remove_resolved_from_folder(
+                folder_path, dry_run, submitted[folder_path], quiet)
+            grand_total_before += before
+            grand_total_after += after
+            grand_total_removed += removed
 
     print("\n" + "="*70)
     print("GRAND TOTAL:")
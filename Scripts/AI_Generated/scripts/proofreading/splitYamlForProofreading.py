@@ -5,7 +5,7 @@ Script to split large YAML files into multiple smaller files for distributed pro
 Location: Scripts/AI_Generated/scripts/proofreading/splitYamlForProofreading.py
 
 Usage (from project root):
-    python3 Scripts/AI_Generated/scripts/proofreading/splitYamlForProofreading.py
+    python3 Scripts/AI_Generated/scripts/proofreading/splitYamlForProofreading.py [--quiet]
 
 This script:
 1. Reads multiple_dhatu_ids_with_gati.yaml and splits into 10 files
@@ -19,96 +19,58 @@ This script:
 6. Each entry includes 'resolved' and 'comment' fields for tracking proofreading progress
 """
 
-import yaml
 import os
 import sys
-from collections import OrderedDict
 import math
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 
-# Custom YAML dumper to preserve strings and formatting
-class QuotedDumper(yaml.SafeDumper):
-    pass
-
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
-
-def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
-
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=QuotedDumper)
-
-
-# Custom loader to force all scalars to strings and preserve order
-class ForceStringLoader(yaml.SafeLoader):
-    pass
-
-def str_constructor(loader, node):
-    return loader.construct_scalar(node)
-
-def dict_constructor(loader, node):
-    return OrderedDict(loader.construct_pairs(node))
-
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:map', dict_constructor)
-
-
-def load_yaml_file(yaml_file):
-    """Load a YAML file"""
-    with open(yaml_file, 'r', encoding='utf-8') as f:
-        return yaml.load(f, Loader=ForceStringLoader)
+# The shared YAML helpers live in Scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from _yaml_fast import WRITE_BUFFER_SIZE, dump_entries, load_entries
 
 
 def write_yaml_file(yaml_file, data, header_comments=None):
     """Write YAML data to file with proper formatting"""
-    with open(yaml_file, 'w', encoding='utf-8') as f:
+    # One large buffer so the header and body reach the OS in a few writes
+    with open(yaml_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
         # Write header comments if provided
         if header_comments:
-            for comment in header_comments:
-                f.write(f"# {comment}\n")
-            f.write("\n")
-
-        yaml.dump(
-            data,
-            f,
-            allow_unicode=True,
-            default_flow_style=False,
-            indent=2,
-            sort_keys=False,
-            width=1000,
-            Dumper=QuotedDumper
-        )
+            f.write(''.join(f"# {comment}\n" for comment in header_comments) + "\n")
+
+        dump_entries(f, data)
+
+
+def _write_part(task):
+    """Write one (output_file, chunk, part_header) task; runs in a worker process"""
+    write_yaml_file(*task)
 
 
 def split_dict_into_chunks(data_dict, num_chunks):
     """Split a dictionary into N roughly equal chunks"""
-    items = list(data_dict.items())
-    total_items = len(items)
-    chunk_size = math.ceil(total_items / num_chunks)
+    chunk_size = math.ceil(len(data_dict) / num_chunks)
+
+    # Consume one iterator chunk by chunk instead of slicing a copied item list
+    items = iter(data_dict.items())
 
     chunks = []
-    for i in range(num_chunks):
-        start_idx = i * chunk_size
-        end_idx = min(start_idx + chunk_size, total_items)
-        chunk_items = items[start_idx:end_idx]
-
-        if chunk_items:  # Only add non-empty chunks
-            # Add review fields to each entry
-            chunk_with_review_fields = OrderedDict()
-            for key, value in chunk_items:
+    for _ in range(num_chunks):
+        chunk = dict(itertools.islice(items, chunk_size))
+
+        if chunk:  # Only add non-empty chunks
+            # Add review fields to each entry in place
+            for value in chunk.values():
                 if isinstance(value, dict):
                     # Add resolved and comment fields for proofreading
                     value['resolved'] = 'false'
                     value['comment'] = ''
-                chunk_with_review_fields[key] = value
 
-            chunks.append(chunk_with_review_fields)
+            chunks.append(chunk)
 
     return chunks
 
 
-def split_yaml_file(input_file, output_folder, num_parts, file_type):
+def split_yaml_file(input_file, output_folder, num_parts, file_type, quiet=False):
     """
     Split a YAML file into multiple parts
 
@@ -117,6 +79,7 @@ def split_yaml_file(input_file, output_folder, num_parts, file_type):
         output_folder: Folder to write split files
         num_parts: Number of parts to split into
         file_type: Type of file ('multiple_dhatu_ids' or 'not_found_dhatu_ids')
+        quiet: Skip the per-part lines and only print the summary
     """
     print(f"\n{'='*70}")
     print(f"Processing: {input_file}")
@@ -124,7 +87,7 @@ def split_yaml_file(input_file, output_folder, num_parts, file_type):
 
     # Load the YAML file
     print(f"📚 Loading YAML file...")
-    data = load_yaml_file(input_file)
+    data = load_entries(input_file)
 
     if not data:
         print(f"❌ No data found in {input_file}")
@@ -166,16 +129,28 @@ def split_yaml_file(input_file, output_folder, num_parts, file_type):
             f"This is part {{part_num}} of {num_parts} - Assigned for proofreading"
         ]
 
+    # Only the part number and entry count lines change between parts
+    needs_format = ['{' in comment for comment in header_comments]
+
     # Write each chunk to a separate file
+    tasks = []
     for i, chunk in enumerate(chunks, 1):
         part_num = f"{i:02d}"
         output_file = os.path.join(output_folder, f"part_{part_num}.yaml")
 
         # Update header comments with actual part number and entry count
-        part_header = [comment.format(part_num=i, entry_count=len(chunk)) for comment in header_comments]
+        part_header = [comment.format(part_num=i, entry_count=len(chunk)) if templated else comment
+                       for comment, templated in zip(header_comments, needs_format)]
+
+        tasks.append((output_file, chunk, part_header))
 
-        write_yaml_file(output_file, chunk, part_header)
-        print(f"  ✅ Created part_{part_num}.yaml ({len(chunk)} entries)")
+    # Each part file is independent, so dump them on all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(_write_part, tasks))
+
+    if not quiet:
+        for output_file, chunk, _ in tasks:
+            print(f"  ✅ Created {os.path.basename(output_file)} ({len(chunk)} entries)")
 
     print(f"\n{'='*70}")
     print(f"✅ Split complete!")
@@ -187,6 +162,8 @@ def split_yaml_file(input_file, output_folder, num_parts, file_type):
 
 def main():
     """Main function to split YAML files"""
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
+
     print("\n" + "="*70)
     print("YAML File Splitter for Distributed Proofreading")
     print("="*70)
@@ -208,7 +185,8 @@ def main():
             multiple_dhatu_ids_with_gati_file,
             multiple_dhatu_ids_with_gati_folder,
             num_parts,
-            'multiple_dhatu_ids'
+            'multiple_dhatu_ids',
+            quiet
         )
     else:
         print(f"⚠️  Skipping: File not found: {multiple_dhatu_ids_with_gati_file}")
@@ -219,7 +197,8 @@ def main():
             multiple_dhatu_ids_without_gati_file,
             multiple_dhatu_ids_without_gati_folder,
             num_parts,
-            'multiple_dhatu_ids'
+            'multiple_dhatu_ids',
+            quiet
         )
     else:
         print(f"⚠️  Skipping: File not found: {multiple_dhatu_ids_without_gati_file}")
@@ -230,7 +209,8 @@ def main():
             not_found_dhatu_ids_file,
             not_found_dhatu_ids_folder,
             num_parts,
-            'not_found_dhatu_ids'
+            'not_found_dhatu_ids',
+            quiet
         )
     else:
         print(f"⚠️  Skipping: File not found: {not_found_dhatu_ids_file}")
@@ -27,21 +27,11 @@ import os
 import subprocess
 import argparse
 import math
-from collections import OrderedDict
 from pathlib import Path
 
-# Custom YAML dumper to preserve strings and formatting
-class QuotedDumper(yaml.SafeDumper):
-    pass
-
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
-
-def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
-
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=QuotedDumper)
+# The shared YAML helpers live in Scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from _yaml_fast import FastSafeLoader, dump_entries
 
 
 def run_collectors(json_file, output_dir):
@@ -90,7 +80,7 @@ def load_yaml_file(yaml_file):
         # Skip comment lines
         lines = f.readlines()
         content = ''.join([line for line in lines if not line.strip().startswith('#')])
-        return yaml.safe_load(content) or OrderedDict()
+        return yaml.load(content, Loader=FastSafeLoader) or {}
 
 
 def load_existing_part_file(yaml_file):
@@ -122,9 +112,9 @@ def write_redistributed_file(yaml_file, data, file_type, part_num, total_parts,
         f.write(f"# This is part {part_num} of {total_parts} - Assigned for proofreading\n\n")
 
         # Enhance data with resolved and comment fields
-        enhanced_data = OrderedDict()
+        enhanced_data = {}
         for key, value in data.items():
-            enhanced_value = OrderedDict(value)
+            enhanced_value = dict(value)
 
             # Preserve existing resolved status and comments if available
             if existing_status and key in existing_status:
@@ -136,16 +126,7 @@ def write_redistributed_file(yaml_file, data, file_type, part_num, total_parts,
 
             enhanced_data[key] = enhanced_value
 
-        yaml.dump(
-            enhanced_data,
-            f,
-            allow_unicode=True,
-            default_flow_style=False,
-            indent=2,
-            sort_keys=False,
-            width=1000,
-            Dumper=QuotedDumper
-        )
+        dump_entries(f, enhanced_data)
 
 
 def collect_resolved_items(redistrib_dir):
@@ -204,7 +185,7 @@ def redistribute_file(input_file, output_dir, file_basename, file_type):
         return 0
 
     # Filter out resolved items from the new data
-    filtered_data = OrderedDict()
+    filtered_data = {}
     skipped_count = 0
     for key, value in data.items():
         if key not in resolved_items:
@@ -236,9 +217,9 @@ def redistribute_file(input_file, output_dir, file_basename, file_type):
 
         if start_idx >= total_items:
             # No more items, but we still need to write an empty file
-            part_data = OrderedDict()
+            part_data = {}
         else:
-            part_data = OrderedDict(items[start_idx:end_idx])
+            part_data = dict(items[start_idx:end_idx])
 
         # Load existing status (resolved/comment) from the part file for items still present
         existing_status = load_existing_part_file(part_file)
@@ -9,33 +9,11 @@ that need to be corrected in each file.
 import yaml
 import os
 import sys
-from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
-# Custom YAML dumper and loader
-class QuotedDumper(yaml.SafeDumper):
-    pass
-
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
-
-def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
-
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=QuotedDumper)
-
-class ForceStringLoader(yaml.SafeLoader):
-    pass
-
-def str_constructor(loader, node):
-    return loader.construct_scalar(node)
-
-def dict_constructor(loader, node):
-    return OrderedDict(loader.construct_pairs(node))
-
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:map', dict_constructor)
+# The shared YAML helpers live in Scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from _yaml_fast import WRITE_BUFFER_SIZE, ForceStringLoader, dump_entries
 
 
 def load_yaml_file(yaml_file):
@@ -46,23 +24,58 @@ def load_yaml_file(yaml_file):
 
 def write_yaml_with_header(yaml_file, data, header_lines):
     """Write YAML data to file with custom header"""
-    with open(yaml_file, 'w', encoding='utf-8') as f:
+    # One large buffer so the header and body reach the OS in a few writes
+    with open(yaml_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
         # Write header
-        for line in header_lines:
-            f.write(f"{line}\n")
-        f.write("\n")
+        f.write(''.join(f"{line}\n" for line in header_lines) + "\n")
 
         # Write YAML data
-        yaml.dump(
-            data,
-            f,
-            allow_unicode=True,
-            default_flow_style=False,
-            indent=2,
-            sort_keys=False,
-            width=1000,
-            Dumper=QuotedDumper
-        )
+        dump_entries(f, data)
+
+
+def update_part_file(part_path, file_type):
+    """
+    Rewrite the header of a single part file with its entry count.
+
+    Returns: Number of entries in the file
+    """
+    part_num = os.path.basename(part_path).replace('part_', '').replace('.yaml', '')
+
+    # Load the file
+    data = load_yaml_file(part_path)
+    entry_count = len(data)
+
+    # Create updated header
+    if file_type == 'multiple_dhatu_ids':
+        header = [
+            "# Cases where a verb has more than one dhatu_id",
+            "# Format: Each entry shows the verb form with its multiple dhatu_ids",
+            "# Manually edit this file to select the correct dhatu_id for each case",
+            "# After editing, run the backport script to sync changes back to original YAML files",
+            "# ",
+            f"# ENTRIES TO CORRECT: {entry_count}",
+            f"# This is part {int(part_num)} of 10 - Assigned for proofreading"
+        ]
+    else:  # not_found_dhatu_ids
+        header = [
+            "# Cases where a verb has 'Not Found' dhatu_id (verbs WITHOUT gati)",
+            "# Format: Each entry shows the verb form that needs a dhatu_id assigned",
+            "# Manually edit this file to add the correct dhatu_id for each case",
+            "# After editing, run the backport script to sync changes back to original YAML files",
+            "#",
+            "# Instructions:",
+            "#   1. Find the correct dhatu_id for each verb",
+            "#   2. Change dhatu_id from 'Not Found' to the correct ID (e.g., '01.0594')",
+            "#   3. Keep the gati field as is (don't modify it)",
+            "#   4. Run backport script to apply changes",
+            "#",
+            f"# ENTRIES TO CORRECT: {entry_count}",
+            f"# This is part {int(part_num)} of 10 - Assigned for proofreading"
+        ]
+
+    # Write updated file
+    write_yaml_with_header(part_path, data, header)
+    return entry_count
 
 
 def update_folder(folder_path, file_type):
@@ -71,47 +84,17 @@ def update_folder(folder_path, file_type):
     print(f"Processing: {os.path.basename(folder_path)}")
     print(f"{'='*70}\n")
 
-    part_files = sorted([f for f in os.listdir(folder_path)
-                         if f.startswith('part_') and f.endswith('.yaml')])
-
-    for part_file in part_files:
-        part_path = os.path.join(folder_path, part_file)
-        part_num = part_file.replace('part_', '').replace('.yaml', '')
-
-        # Load the file
-        data = load_yaml_file(part_path)
-        entry_count = len(data)
-
-        # Create updated header
-        if file_type == 'multiple_dhatu_ids':
-            header = [
-                "# Cases where a verb has more than one dhatu_id",
-                "# Format: Each entry shows the verb form with its multiple dhatu_ids",
-                "# Manually edit this file to select the correct dhatu_id for each case",
-                "# After editing, run the backport script to sync changes back to original YAML files",
-                "# ",
-                f"# ENTRIES TO CORRECT: {entry_count}",
-                f"# This is part {int(part_num)} of 10 - Assigned for proofreading"
-            ]
-        else:  # not_found_dhatu_ids
-            header = [
-                "# Cases where a verb has 'Not Found' dhatu_id (verbs WITHOUT gati)",
-                "# Format: Each entry shows the verb form that needs a dhatu_id assigned",
-                "# Manually edit this file to add the correct dhatu_id for each case",
-                "# After editing, run the backport script to sync changes back to original YAML files",
-                "#",
-                "# Instructions:",
-                "#   1. Find the correct dhatu_id for each verb",
-                "#   2. Change dhatu_id from 'Not Found' to the correct ID (e.g., '01.0594')",
-                "#   3. Keep the gati field as is (don't modify it)",
-                "#   4. Run backport script to apply changes",
-                "#",
-                f"# ENTRIES TO CORRECT: {entry_count}",
-                f"# This is part {int(part_num)} of 10 - Assigned for proofreading"
-            ]
-
-        # Write updated file
-        write_yaml_with_header(part_path, data, header)
+    with os.scandir(folder_path) as entries:
+        part_files = sorted(entry.name for entry in entries
+                            if entry.name.startswith('part_') and entry.name.endswith('.yaml'))
+    part_paths = [os.path.join(folder_path, f) for f in part_files]
+
+    # Each part file is independent, so parse/dump them on all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        entry_counts = list(executor.map(update_part_file, part_paths,
+                                         [file_type] * len(part_paths)))
+
+    for part_file, entry_count in zip(part_files, entry_counts):
         print(f"  ✅ Updated {part_file}: {entry_count} entries")
 
     print(f"\n  Total files updated: {len(part_files)}")
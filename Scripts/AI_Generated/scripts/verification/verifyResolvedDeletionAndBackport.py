@@ -6,104 +6,134 @@ Comprehensive verification of:
 """
 
 import yaml
+import importlib.util
+import io
+import itertools
+import mmap
 import os
 import sys
 import shutil
-from collections import OrderedDict
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 
-# Custom YAML dumper and loader
-class QuotedDumper(yaml.SafeDumper):
-    pass
+# The shared YAML helpers live in Scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from _yaml_fast import ForceStringLoader, dump_entries
 
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
 
-def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
-
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=QuotedDumper)
+def load_yaml_file(yaml_file):
+    """Load a YAML file"""
+    with open(yaml_file, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return yaml.load(f.read(), Loader=ForceStringLoader)
 
-class ForceStringLoader(yaml.SafeLoader):
-    pass
+        # Let the parser read straight from the page cache
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=ForceStringLoader)
 
-def str_constructor(loader, node):
-    return loader.construct_scalar(node)
 
-def dict_constructor(loader, node):
-    return OrderedDict(loader.construct_pairs(node))
+def load_yaml_file_with_header(yaml_file):
+    """
+    Read a YAML file's header comment lines and data from one mapping.
 
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:map', dict_constructor)
+    Returns: (header_lines, data)
+    """
+    with open(yaml_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], yaml.load(f.read(), Loader=ForceStringLoader)
 
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_lines = []
+            for raw in iter(mm.readline, b''):
+                if raw[:1] == b'#':
+                    header_lines.append(raw.rstrip().decode('utf-8'))
+                elif raw.strip():
+                    break
 
-def load_yaml_file(yaml_file):
-    """Load a YAML file"""
-    with open(yaml_file, 'r', encoding='utf-8') as f:
-        return yaml.load(f, Loader=ForceStringLoader)
-
-
-def read_header_lines(yaml_file):
-    """Read header lines"""
-    header_lines = []
-    with open(yaml_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.startswith('#'):
-                header_lines.append(line.rstrip())
-            elif line.strip():
-                break
-    return header_lines
+            # The comments are skipped by the parser, so hand it the whole mapping
+            mm.seek(0)
+            return header_lines, yaml.load(mm, Loader=ForceStringLoader)
 
 
 def write_yaml_with_header(yaml_file, data, header_lines):
     """Write YAML with header"""
-    with open(yaml_file, 'w', encoding='utf-8') as f:
-        for line in header_lines:
-            f.write(f"{line}\n")
-        f.write("\n")
-        yaml.dump(data, f, allow_unicode=True, default_flow_style=False,
-                  indent=2, sort_keys=False, width=1000, Dumper=QuotedDumper)
-
-
-def find_data_yaml_file(kanda, varga, adhikaar=''):
-    """Find the corresponding YAML file in Data folder"""
-    kanda_map = {
-        'प्रथमकाण्डः': '1',
-        'द्वितीयकाण्डः': '2',
-        'तृतीयकाण्डः': '3'
-    }
-
-    kanda_id = kanda_map.get(kanda)
-    if not kanda_id:
-        return None
-
-    kanda_folder = f"Data/{kanda_id}_{kanda}"
-    if not os.path.exists(kanda_folder):
-        return None
-
-    if adhikaar:
-        for item in os.listdir(kanda_folder):
-            if varga in item and os.path.isdir(os.path.join(kanda_folder, item)):
-                varga_folder = os.path.join(kanda_folder, item)
-                adhikaar_to_file = {
-                    'भ्वादिगणः': '1', 'अदादिगणः': '2', 'जुहोत्यादिगणः': '3',
-                    'दिवादिगणः': '4', 'स्वादिगणः': '5', 'तुदादिगणः': '6',
-                    'रुधादिगणः': '7', 'तनादिगणः': '8', 'क्रयादिगणः': '9',
-                    'चुरादिगणः': '10', 'नामधातवः': '11', 'कण्ड्वादयः': '12'
-                }
-                file_num = adhikaar_to_file.get(adhikaar)
-                if file_num:
-                    yaml_file = os.path.join(varga_folder, f"{file_num}_{adhikaar}.yaml")
-                    if os.path.exists(yaml_file):
-                        return yaml_file
-    else:
-        for item in os.listdir(kanda_folder):
-            if varga in item and item.endswith('.yaml'):
-                yaml_file = os.path.join(kanda_folder, item)
-                if os.path.exists(yaml_file):
-                    return yaml_file
-    return None
+    text = io.StringIO()
+    text.write(''.join(f"{line}\n" for line in header_lines) + "\n")
+    dump_entries(text, data)
+    content = text.getvalue().encode('utf-8')
+
+    # Leave the file alone when it already holds exactly this content (e.g.
+    # rerunning on entries that are already resolved); the size check skips
+    # reading it back whenever the content has visibly changed
+    try:
+        if os.path.getsize(yaml_file) == len(content):
+            with open(yaml_file, 'rb') as f:
+                if f.read() == content:
+                    return
+    except FileNotFoundError:
+        pass
+
+    # Write the whole file under a temporary name and rename it into place,
+    # so the scripts under test never read a half-written file
+    tmp_file = yaml_file + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_file, yaml_file)
+
+
+# The workflow scripts this verification drives
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_script(relative_path):
+    """Import a workflow script by path, so it can run in this process"""
+    script_path = os.path.join(SCRIPTS_DIR, relative_path)
+    module_name = os.path.splitext(os.path.basename(script_path))[0]
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    # Sibling imports resolve from the script's own folder
+    sys.path.insert(0, os.path.dirname(script_path))
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_logged(log_file, func, *args):
+    """
+    Call func with its output sent to log_file, like a shell redirect.
+
+    Returns: 0 on success, 1 if it raised or exited with an error
+    """
+    with open(log_file, 'w', encoding='utf-8') as log, redirect_stdout(log), redirect_stderr(log):
+        try:
+            func(*args)
+        except SystemExit as e:
+            return 1 if e.code else 0
+        except Exception:
+            traceback.print_exc()
+            return 1
+    return 0
+
+
+def find_form_value(data_yaml, artha, form):
+    """
+    Find a verb form under its artha in a loaded Data file.
+
+    Each file is searched once, so this stops at the first match rather
+    than indexing every shloka.
+
+    Returns: (found, value) for the first shloka that lists the form
+    """
+    for shloka_data in data_yaml.values():
+        if isinstance(shloka_data, dict) and isinstance(shloka_data.get(artha), dict):
+            if form in shloka_data[artha]:
+                return True, shloka_data[artha][form]
+    return False, None
 
 
 def test_resolved_deletion():
@@ -121,14 +151,12 @@ def test_resolved_deletion():
     shutil.copy2(test_file, backup_file)
 
     # Load file
-    header = read_header_lines(test_file)
-    data = load_yaml_file(test_file)
+    header, data = load_yaml_file_with_header(test_file)
     original_count = len(data)
     print(f"   Original entries: {original_count}")
 
     # Mark 5 specific entries as resolved
-    keys = list(data.keys())
-    entries_to_resolve = keys[:5]
+    entries_to_resolve = list(itertools.islice(data, 5))
 
     print(f"\n2️⃣  Marking 5 entries as resolved=true:")
     for i, key in enumerate(entries_to_resolve, 1):
@@ -141,7 +169,9 @@ def test_resolved_deletion():
 
     # Run removeResolvedEntries.py
     print(f"\n3️⃣  Running removeResolvedEntries.py...")
-    exit_code = os.system(f"python3 Scripts/AI_Generated/scripts/removeResolvedEntries.py > /tmp/deletion_test.log 2>&1")
+    # Only the file under test, so no other part file is modified
+    remove_resolved = load_script('proofreading/removeResolvedEntries.py')
+    exit_code = run_logged("/tmp/deletion_test.log", remove_resolved.remove_resolved_from_file, test_file)
 
     if exit_code != 0:
         print(f"   ❌ Script failed with exit code {exit_code}")
@@ -190,6 +220,10 @@ def test_backporting_with_review_fields():
     print("TEST 2: VERIFY BACKPORTING WORKS WITH REVIEW FIELDS")
     print("="*70)
 
+    # The backport scripts also locate the Data files the test checks
+    backport_multiple = load_script('backport/backportMultipleDhatuIds.py')
+    backport_not_found = load_script('backport/backportNotFoundDhatuIds.py')
+
     # Test both multiple_dhatu_ids and not_found
     test_file1 = "Scripts/AI_Generated/output/multipleDhatuIdsWithoutGati/part_03.yaml"
     test_file2 = "Scripts/AI_Generated/output/notFoundDhatuIdsWithoutGati/part_02.yaml"
@@ -204,10 +238,9 @@ def test_backporting_with_review_fields():
     shutil.copy2(test_file1, backup_file1)
 
     # Load and modify
-    header1 = read_header_lines(test_file1)
-    data1 = load_yaml_file(test_file1)
+    header1, data1 = load_yaml_file_with_header(test_file1)
 
-    first_key = list(data1.keys())[0]
+    first_key = next(iter(data1))
     first_entry = data1[first_key]
 
     print(f"   Entry: {first_key}")
@@ -222,10 +255,12 @@ def test_backporting_with_review_fields():
     data1[first_key]['resolved'] = 'false'  # Not resolved
     data1[first_key]['comment'] = 'Test backport with review fields'
 
-    write_yaml_with_header(test_file1, data1, header1)
+    # Backport only the test entry, so the backed-up Data file is the only one touched
+    write_yaml_with_header(test_file1, {first_key: data1[first_key]}, header1)
 
     # Find Data file to backup
-    data_file = find_data_yaml_file(
+    data_file = backport_multiple.find_yaml_file(
+        "Data",
         first_entry['kanda'],
         first_entry['varga'],
         first_entry.get('adhikaar', '')
@@ -241,7 +276,7 @@ def test_backporting_with_review_fields():
 
     # Run backport
     print(f"\n2️⃣  Running backport script...")
-    exit_code = os.system(f"python3 Scripts/AI_Generated/scripts/backportMultipleDhatuIds.py {test_file1} Data > /tmp/backport_test1.log 2>&1")
+    exit_code = run_logged("/tmp/backport_test1.log", backport_multiple.backport_changes, test_file1, "Data")
 
     if exit_code != 0:
         print(f"   ❌ Backport failed with exit code {exit_code}")
@@ -257,18 +292,15 @@ def test_backporting_with_review_fields():
     form = first_entry['form']
 
     found = False
-    for shloka_key, shloka_data in data_yaml.items():
-        if isinstance(shloka_data, dict) and artha in shloka_data:
-            if isinstance(shloka_data[artha], dict) and form in shloka_data[artha]:
-                current_value = shloka_data[artha][form]
-                print(f"   Found in Data: {form}")
-                print(f"   Value in Data: {current_value}")
-
-                if isinstance(current_value, list) and len(current_value) > 0:
-                    if current_value[-1] == test_dhatu_id or current_value[0] == test_dhatu_id:
-                        print(f"   ✅ Change successfully backported!")
-                        found = True
-                break
+    in_data, current_value = find_form_value(data_yaml, artha, form)
+    if in_data:
+        print(f"   Found in Data: {form}")
+        print(f"   Value in Data: {current_value}")
+
+        if isinstance(current_value, list) and len(current_value) > 0:
+            if current_value[-1] == test_dhatu_id or current_value[0] == test_dhatu_id:
+                print(f"   ✅ Change successfully backported!")
+                found = True
 
     # Restore files
     print(f"\n4️⃣  Restoring files...")
@@ -281,10 +313,9 @@ def test_backporting_with_review_fields():
 
     shutil.copy2(test_file2, backup_file2)
 
-    header2 = read_header_lines(test_file2)
-    data2 = load_yaml_file(test_file2)
+    header2, data2 = load_yaml_file_with_header(test_file2)
 
-    second_key = list(data2.keys())[0]
+    second_key = next(iter(data2))
     second_entry = data2[second_key]
 
     print(f"   Entry: {second_key}")
@@ -296,10 +327,12 @@ def test_backporting_with_review_fields():
     data2[second_key]['resolved'] = 'true'  # Marked as resolved
     data2[second_key]['comment'] = 'Another test with resolved=true'
 
-    write_yaml_with_header(test_file2, data2, header2)
+    # Backport only the test entry, so the backed-up Data file is the only one touched
+    write_yaml_with_header(test_file2, {second_key: data2[second_key]}, header2)
 
     # Find Data file
-    data_file2 = find_data_yaml_file(
+    data_file2 = backport_not_found.find_yaml_file(
+        "Data",
         second_entry['kanda'],
         second_entry['varga'],
         second_entry.get('adhikaar', '')
@@ -315,7 +348,7 @@ def test_backporting_with_review_fields():
 
     # Run backport
     print(f"\n6️⃣  Running backport script...")
-    exit_code = os.system(f"python3 Scripts/AI_Generated/scripts/backportNotFoundDhatuIds.py {test_file2} Data > /tmp/backport_test2.log 2>&1")
+    exit_code = run_logged("/tmp/backport_test2.log", backport_not_found.backport_changes, test_file2, "Data")
 
     # Verify change
     print(f"\n7️⃣  Verifying change in Data file...")
@@ -325,18 +358,15 @@ def test_backporting_with_review_fields():
     form2 = second_entry['form']
 
     found2 = False
-    for shloka_key, shloka_data in data_yaml2.items():
-        if isinstance(shloka_data, dict) and artha2 in shloka_data:
-            if isinstance(shloka_data[artha2], dict) and form2 in shloka_data[artha2]:
-                current_value = shloka_data[artha2][form2]
-                print(f"   Found in Data: {form2}")
-                print(f"   Value in Data: {current_value}")
-
-                if isinstance(current_value, list) and len(current_value) > 0:
-                    if current_value[-1] == test_dhatu_id2 or current_value[0] == test_dhatu_id2:
-                        print(f"   ✅ Change successfully backported (even with resolved=true)!")
-                        found2 = True
-                break
+    in_data, current_value = find_form_value(data_yaml2, artha2, form2)
+    if in_data:
+        print(f"   Found in Data: {form2}")
+        print(f"   Value in Data: {current_value}")
+
+        if isinstance(current_value, list) and len(current_value) > 0:
+            if current_value[-1] == test_dhatu_id2 or current_value[0] == test_dhatu_id2:
+                print(f"   ✅ Change successfully backported (even with resolved=true)!")
+                found2 = True
 
     # Restore
     print(f"\n8️⃣  Restoring files...")
@@ -351,15 +381,40 @@ def test_backporting_with_review_fields():
         return False
 
 
+def run_captured(test):
+    """
+    Run one test with its narration captured.
+
+    Runs in a worker process, so it only returns plain data for the caller to print.
+
+    Returns: (passed, output)
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        passed = test()
+    return passed, output.getvalue()
+
+
 def main():
     """Run all verification tests"""
+    # Flush the narration once per test instead of on every line
+    sys.stdout.reconfigure(line_buffering=False)
+
     print("\n" + "="*70)
     print("COMPREHENSIVE VERIFICATION")
     print("Testing: Entry Deletion and Backporting")
     print("="*70)
+    sys.stdout.flush()
+
+    # The tests touch different part and Data files, so run them side by side
+    tests = [test_resolved_deletion, test_backporting_with_review_fields]
+    with ProcessPoolExecutor(max_workers=len(tests)) as executor:
+        results = list(executor.map(run_captured, tests))
 
-    test1_passed = test_resolved_deletion()
-    test2_passed = test_backporting_with_review_fields()
+    for _, output in results:
+        sys.stdout.write(output)
+        sys.stdout.flush()
+    (test1_passed, _), (test2_passed, _) = results
 
     print("\n" + "="*70)
     print("FINAL RESULTS")
@@ -12,21 +12,11 @@ This script:
 import yaml
 import os
 import sys
-from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
-# Custom loader to force all scalars to strings and preserve order
-class ForceStringLoader(yaml.SafeLoader):
-    pass
-
-def str_constructor(loader, node):
-    return loader.construct_scalar(node)
-
-def dict_constructor(loader, node):
-    return OrderedDict(loader.construct_pairs(node))
-
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:map', dict_constructor)
+# The shared YAML helpers live in Scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from _yaml_fast import ForceStringLoader
 
 
 def load_yaml_file(yaml_file):
@@ -35,6 +25,16 @@ def load_yaml_file(yaml_file):
         return yaml.load(f, Loader=ForceStringLoader)
 
 
+def same_entry(original, split):
+    """
+    Compare two entries field by field and in order. The loader builds plain
+    dicts, whose == ignores order, and a split that reorders fields is an error.
+    """
+    if isinstance(original, dict) and isinstance(split, dict):
+        return list(original.items()) == list(split.items())
+    return original == split
+
+
 def verify_split(original_file, split_folder, file_type):
     """
     Verify that split files contain all data from original file.
@@ -48,31 +48,37 @@ def verify_split(original_file, split_folder, file_type):
     # Load original file
     print(f"📚 Loading original file...")
     original_data = load_yaml_file(original_file)
-    original_keys = set(original_data.keys())
     original_count = len(original_data)
     print(f"   Original entries: {original_count}")
 
     # Load all split files
     print(f"📁 Loading split files from {os.path.basename(split_folder)}...")
-    combined_data = OrderedDict()
+    # Check each part entry against the original as it is loaded rather than
+    # merging every part into a second copy of the data; a key repeated in a
+    # later part overrides the earlier result, as a merge would
+    part_matches = {}
     part_files = sorted([f for f in os.listdir(split_folder) if f.startswith('part_') and f.endswith('.yaml')])
+    part_paths = [os.path.join(split_folder, part_file) for part_file in part_files]
+
+    # Each part file is independent, so parse them on all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        parts = list(executor.map(load_yaml_file, part_paths))
 
-    for part_file in part_files:
-        part_path = os.path.join(split_folder, part_file)
-        part_data = load_yaml_file(part_path)
+    for part_file, part_data in zip(part_files, parts):
         print(f"   {part_file}: {len(part_data)} entries")
-        combined_data.update(part_data)
+        for key, value in part_data.items():
+            part_matches[key] = key in original_data and same_entry(original_data[key], value)
 
-    split_keys = set(combined_data.keys())
-    split_count = len(combined_data)
+    split_count = len(part_matches)
 
     print(f"\n📊 Summary:")
     print(f"   Total split entries: {split_count}")
     print(f"   Original entries:    {original_count}")
 
-    # Check for missing or extra keys
-    missing_keys = original_keys - split_keys
-    extra_keys = split_keys - original_keys
+    # Check for missing or extra keys (set operations on the key views probe
+    # the other dict directly instead of copying either key set)
+    missing_keys = original_data.keys() - part_matches.keys()
+    extra_keys = part_matches.keys() - original_data.keys()
 
     is_valid = (original_count == split_count and
                 len(missing_keys) == 0 and
@@ -83,11 +89,13 @@ def verify_split(original_file, split_folder, file_type):
 
         # Deep comparison of data
         print(f"\n🔍 Deep comparison of data...")
-        all_match = True
-        for key in original_keys:
-            if original_data[key] != combined_data[key]:
-                print(f"   ⚠️  Data mismatch for key: {key}")
-                all_match = False
+        # Values were compared while loading; walk the keys only to report
+        # the mismatches in file order
+        all_match = all(part_matches.values())
+        if not all_match:
+            for key in original_data:
+                if not part_matches[key]:
+                    print(f"   ⚠️  Data mismatch for key: {key}")
 
         if all_match:
             print(f"   ✅ All data matches perfectly!")
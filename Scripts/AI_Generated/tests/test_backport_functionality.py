@@ -12,36 +12,34 @@ This script:
 
 import yaml
 import os
+import sys
 import shutil
 import json
-from collections import OrderedDict
+import subprocess
+import threading
 
-# Custom YAML dumper (same as in collectMultipleDhatuIds.py)
-class QuotedDumper(yaml.SafeDumper):
-    pass
+# The backport script lives in scripts/backport, next to this tests folder,
+# and the shared YAML helpers in Scripts/
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'scripts', 'backport'))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', '..'))
+from _yaml_fast import ForceStringLoader
+from backportMultipleDhatuIds import build_shloka_index, find_yaml_file
 
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
+# Seconds the backport run may take before it is killed
+BACKPORT_TIMEOUT = 60
 
-def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
-
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=QuotedDumper)
+# Custom YAML dumper (same as in collectMultipleDhatuIds.py), emitting with
+# libyaml when available since the test files are only read back by the loader
+_BaseDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
-# Custom YAML loader
-class ForceStringLoader(yaml.SafeLoader):
+class QuotedDumper(_BaseDumper):
     pass
 
-def str_constructor(loader, node):
-    return loader.construct_scalar(node)
-
-def dict_constructor(loader, node):
-    return OrderedDict(loader.construct_pairs(node))
+def quoted_str_representer(dumper, data):
+    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
 
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:map', dict_constructor)
+yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
 
 
 def create_test_file():
@@ -52,8 +50,8 @@ def create_test_file():
     test_cases_with_gati = []
 
     # Get 3 test cases from each file
-    without_gati_file = "Scripts/output/multiple_dhatu_ids_without_gati.yaml"
-    with_gati_file = "Scripts/output/multiple_dhatu_ids_with_gati.yaml"
+    without_gati_file = "Scripts/AI_Generated/output/multiple_dhatu_ids_without_gati.yaml"
+    with_gati_file = "Scripts/AI_Generated/output/multiple_dhatu_ids_with_gati.yaml"
 
     if os.path.exists(without_gati_file):
         with open(without_gati_file, 'r', encoding='utf-8') as f:
@@ -89,7 +87,7 @@ def create_test_yaml_files(test_cases_without_gati, test_cases_with_gati):
 
     # For WITHOUT gati file - modify the first entry
     if test_cases_without_gati:
-        test_data = OrderedDict()
+        test_data = {}
         for i, (key, value) in enumerate(test_cases_without_gati):
             if i == 0:
                 # Modify the dhatu_ids - take only the first ID
@@ -115,7 +113,7 @@ def create_test_yaml_files(test_cases_without_gati, test_cases_with_gati):
 
     # For WITH gati file - modify the first entry
     if test_cases_with_gati:
-        test_data = OrderedDict()
+        test_data = {}
         for i, (key, value) in enumerate(test_cases_with_gati):
             if i == 0:
                 # Modify the dhatu_ids - take only the first ID
@@ -157,7 +155,6 @@ def backup_original_files(test_cases_without_gati, test_cases_with_gati):
         adhikaar = value.get('adhikaar')
 
         # Find the file path
-        from backportMultipleDhatuIds import find_yaml_file
         yaml_file = find_yaml_file('Data', kanda, varga, adhikaar if adhikaar else None)
 
         if yaml_file and os.path.exists(yaml_file):
@@ -170,6 +167,19 @@ def backup_original_files(test_cases_without_gati, test_cases_with_gati):
     return backups
 
 
+def find_verb_value(shloka_data, artha, form):
+    """
+    Look up a verb form under its artha in one shloka's data.
+
+    Returns: (found, value)
+    """
+    if shloka_data and isinstance(shloka_data, dict):
+        artha_data = shloka_data.get(artha)
+        if isinstance(artha_data, dict) and form in artha_data:
+            return True, artha_data[form]
+    return False, None
+
+
 def verify_backport(test_cases_without_gati, test_cases_with_gati):
     """Verify that the backport was applied correctly"""
 
@@ -185,6 +195,9 @@ def verify_backport(test_cases_without_gati, test_cases_with_gati):
 
     verification_passed = True
 
+    # Parsed data and shloka index per Data file, shared by cases in that file
+    loaded_files = {}
+
     for test_type, (key, value) in all_test_cases:
         form = value.get('form')
         expected_dhatu_id = value.get('dhatu_ids').split(',')[0].strip()
@@ -199,7 +212,6 @@ def verify_backport(test_cases_without_gati, test_cases_with_gati):
         print(f"   Expected dhatu_id: {expected_dhatu_id}")
 
         # Find and read the original file
-        from backportMultipleDhatuIds import find_yaml_file
         yaml_file = find_yaml_file('Data', kanda, varga, adhikaar if adhikaar else None)
 
         if not yaml_file:
@@ -207,26 +219,24 @@ def verify_backport(test_cases_without_gati, test_cases_with_gati):
             verification_passed = False
             continue
 
-        # Read the file
-        with open(yaml_file, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.load(f, Loader=ForceStringLoader)
-
-        # Find the verb in the YAML data
-        found = False
-        actual_value = None
-
-        for shloka_key in yaml_data.keys():
-            if shloka_text.strip() in shloka_key or shloka_key.strip() in shloka_text:
-                shloka_data = yaml_data[shloka_key]
+        # Read the file once, however many cases it holds
+        if yaml_file not in loaded_files:
+            with open(yaml_file, 'r', encoding='utf-8') as f:
+                yaml_data = yaml.load(f, Loader=ForceStringLoader)
+            loaded_files[yaml_file] = (yaml_data, build_shloka_index(yaml_data))
+        yaml_data, shloka_index = loaded_files[yaml_file]
 
-                if shloka_data and isinstance(shloka_data, dict):
-                    if artha in shloka_data:
-                        artha_data = shloka_data[artha]
+        # Find the verb in the YAML data, trying the shloka whose key matches
+        # exactly first and only scanning for substring matches otherwise
+        shloka_key = shloka_index.get(shloka_text.strip())
+        found, actual_value = find_verb_value(yaml_data.get(shloka_key), artha, form)
 
-                        if isinstance(artha_data, dict) and form in artha_data:
-                            actual_value = artha_data[form]
-                            found = True
-                            break
+        if not found:
+            for shloka_key in yaml_data.keys():
+                if shloka_text.strip() in shloka_key or shloka_key.strip() in shloka_text:
+                    found, actual_value = find_verb_value(yaml_data[shloka_key], artha, form)
+                    if found:
+                        break
 
         if not found:
             print(f"   ❌ FAIL: Could not find verb '{form}' in YAML file")
@@ -284,11 +294,18 @@ def restore_backups(backups):
 
     for original_file, backup_file in backups:
         if os.path.exists(backup_file):
-            shutil.copy2(backup_file, original_file)
-            os.remove(backup_file)
+            # The backup is a full copy, so move it back instead of copying
+            os.replace(backup_file, original_file)
             print(f"✅ Restored: {original_file}")
 
 
+def stream_output(pipe, captured):
+    """Echo a subprocess's output as it arrives, keeping a copy of each line"""
+    for line in pipe:
+        print(line, end='')
+        captured.append(line)
+
+
 def main():
     print("="*70)
     print("BACKPORT FUNCTIONALITY TEST")
@@ -323,23 +340,40 @@ def main():
 
     # Step 4: Run backport script
     print("\n🔄 Step 4: Running backport script...")
-    import subprocess
 
     try:
-        # Run backport on test directory
-        result = subprocess.run(
-            ['python3', 'Scripts/backportMultipleDhatuIds.py', 'Scripts/test_output', 'Data'],
-            capture_output=True,
+        # Run backport on test directory, streaming its output (errors
+        # included) as it runs instead of buffering all of it
+        process = subprocess.Popen(
+            ['python3', 'Scripts/AI_Generated/scripts/backport/backportMultipleDhatuIds.py',
+             'Scripts/test_output', 'Data'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=60
+            bufsize=1
         )
 
+        # Read on a separate thread so the deadline holds even while the
+        # script is still producing output
         print("Backport output:")
-        print(result.stdout)
+        captured = []
+        reader = threading.Thread(target=stream_output, args=(process.stdout, captured), daemon=True)
+        reader.start()
+        try:
+            returncode = process.wait(timeout=BACKPORT_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            reader.join(timeout=5)
+            print(f"❌ Backport script timed out after {BACKPORT_TIMEOUT}s")
+            restore_backups(backups)
+            return False
+        reader.join()
 
-        if result.returncode != 0:
-            print(f"❌ Backport script failed with return code {result.returncode}")
-            print(f"Error output:\n{result.stderr}")
+        if returncode != 0:
+            print(f"❌ Backport script failed with return code {returncode}")
+            print("Last output:")
+            print(''.join(captured[-20:]), end='')
             restore_backups(backups)
             return False
 
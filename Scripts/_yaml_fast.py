@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Shared YAML setup for the Scripts and the AI_Generated tools.
+
+The dumper/loader configuration is registered once here at import, and
+part files are written through dump_entries with a single frozen set of
+dump options.
+"""
+
+import re
+import sys
+import yaml
+
+# Parse with libyaml when available. The dumper stays pure-Python because
+# libyaml emits keys over 128 bytes (shloka lines) as explicit "? key" entries.
+try:
+    from yaml import CSafeLoader as FastSafeLoader
+except ImportError:
+    from yaml import SafeLoader as FastSafeLoader
+
+# Custom YAML dumper to preserve strings and formatting
+class QuotedDumper(yaml.SafeDumper):
+    pass
+
+def quoted_str_representer(dumper, data):
+    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
+
+yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
+
+
+# Custom loader to force all scalars to strings (plain dicts keep key order)
+class ForceStringLoader(FastSafeLoader):
+    pass
+
+def str_constructor(loader, node):
+    return loader.construct_scalar(node)
+
+# Field names repeated in every entry; interning them lets all entries share
+# one key object per name instead of a fresh string per occurrence
+_FIELD_NAMES = frozenset({
+    'form', 'dhatu_id', 'dhatu_ids', 'gati', 'kanda', 'varga', 'adhikaar',
+    'artha', 'shloka_num', 'shloka_text', 'resolved', 'comment',
+})
+
+def interned_str_constructor(loader, node):
+    value = loader.construct_scalar(node)
+    return sys.intern(value) if value in _FIELD_NAMES else value
+
+ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
+ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
+ForceStringLoader.add_constructor(u'tag:yaml.org,2002:str', interned_str_constructor)
+
+# Numeric-looking plain scalars resolve straight to str, instead of matching
+# the int/float patterns only to be turned back into strings; the int/float
+# constructors above still cover explicitly tagged values
+_NUMERIC_TAGS = ('tag:yaml.org,2002:int', 'tag:yaml.org,2002:float')
+ForceStringLoader.yaml_implicit_resolvers = {
+    first_char: [(tag, regexp) for tag, regexp in resolvers if tag not in _NUMERIC_TAGS]
+    for first_char, resolvers in FastSafeLoader.yaml_implicit_resolvers.items()
+}
+
+
+# Characters QuotedDumper escapes inside a double-quoted scalar
+# (allow_unicode=True); everything else is written verbatim
+_ESCAPED_CHAR_RE = re.compile(
+    r'[^\x20\x21\x23-\x5B\x5D-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFEFE\uFF00-\uFFFD]'
+)
+
+# The emitter's named escapes; other characters use \xXX, \uXXXX or \UXXXXXXXX
+_ESCAPE_REPLACEMENTS = {
+    '\0': '0', '\x07': 'a', '\x08': 'b', '\x09': 't', '\x0A': 'n',
+    '\x0B': 'v', '\x0C': 'f', '\x0D': 'r', '\x1B': 'e', '"': '"',
+    '\\': '\\', '\x85': 'N', '\u2028': 'L', '\u2029': 'P',
+}
+
+# Keys containing these are multiline, and the emitter writes them as "? key"
+_LINE_BREAK_RE = re.compile('[\n\x85\u2028\u2029]')
+
+# QuotedDumper writes empty or longer keys as explicit "? key" entries (its
+# 128-character limit counts the "!!str" tag too), and folds lines that run
+# past the dump width
+MAX_SIMPLE_KEY_LENGTH = 122
+DUMP_WIDTH = 1000
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Leading run of comment and blank lines at the top of a YAML file
+_HEADER_BLOCK_RE = re.compile(r'(?:#[^\n]*\n?|[ \t\r]*\n)*')
+
+_DUMP_KW = {
+    'allow_unicode': True,
+    'default_flow_style': False,
+    'indent': 2,
+    'sort_keys': False,
+    'width': DUMP_WIDTH,
+    'Dumper': QuotedDumper,
+}
+
+
+def load_entries(yaml_file):
+    """Load a YAML file"""
+    with open(yaml_file, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=ForceStringLoader)
+
+
+def parse_header_lines(lines):
+    """Collect the leading comment lines of a YAML file"""
+    header_lines = []
+    for line in lines:
+        if line.startswith('#'):
+            header_lines.append(line.rstrip())
+        elif line.strip():  # Stop at first non-comment, non-empty line
+            break
+    return header_lines
+
+
+def split_header(content):
+    """
+    Split YAML text at the end of its leading comment block.
+
+    Returns: (header_lines, body_text)
+    """
+    body_offset = _HEADER_BLOCK_RE.match(content).end()
+    return parse_header_lines(content[:body_offset].splitlines()), content[body_offset:]
+
+
+def load_entries_with_header(yaml_file):
+    """
+    Read a YAML file once and split off its header comments.
+
+    Returns: (header_lines, data)
+    """
+    with open(yaml_file, 'r', encoding='utf-8') as f:
+        header_lines, body = split_header(f.read())
+    return header_lines, yaml.load(body, Loader=ForceStringLoader)
+
+
+def _escape_char(match):
+    ch = match.group()
+    if ch in _ESCAPE_REPLACEMENTS:
+        return '\\' + _ESCAPE_REPLACEMENTS[ch]
+    if ch <= '\xFF':
+        return '\\x%02X' % ord(ch)
+    if ch <= '\uFFFF':
+        return '\\u%04X' % ord(ch)
+    return '\\U%08X' % ord(ch)
+
+
+def quote_scalar(text):
+    """Double-quote a string exactly as QuotedDumper does"""
+    return '"' + _ESCAPED_CHAR_RE.sub(_escape_char, text) + '"'
+
+
+def is_simple_key(key):
+    """Whether QuotedDumper writes key as a simple key rather than a "? key" entry"""
+    return (isinstance(key, str) and 0 < len(key) <= MAX_SIMPLE_KEY_LENGTH
+            and not _LINE_BREAK_RE.search(key))
+
+
+def format_flat_entries(data):
+    """
+    Format {key: {field: value}} string data exactly as QuotedDumper would.
+
+    This skips the generic emitter for the fixed shape of the split files.
+
+    Returns: The YAML text, or None if the data does not fit that shape
+    (the caller then falls back to yaml.dump)
+    """
+    if not data:
+        return None
+
+    lines = []
+    for key, entry in data.items():
+        if not is_simple_key(key) or not isinstance(entry, dict) or not entry:
+            return None
+        lines.append(f'{quote_scalar(key)}:\n')
+
+        for field, value in entry.items():
+            if not is_simple_key(field) or not isinstance(value, str):
+                return None
+            line = f'  {quote_scalar(field)}: {quote_scalar(value)}\n'
+            if len(line) > DUMP_WIDTH:
+                return None
+            lines.append(line)
+
+    return ''.join(lines)
+
+
+def dump_entries(f, data):
+    """Write YAML data to an open file, directly when it has the usual split-file shape"""
+    flat_text = format_flat_entries(data)
+    if flat_text is not None:
+        f.write(flat_text)
+        return
+
+    yaml.dump(data, f, **_DUMP_KW)
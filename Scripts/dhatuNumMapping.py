@@ -8,14 +8,8 @@ url = "https://raw.githubusercontent.com/ashtadhyayi-com/data/master/dhatu/dhatu
 response = requests.get(url)
 response.raise_for_status()  # Raise an exception for HTTP errors
 
-# Read the content as text
-txt_data = response.text
-
-# Convert the text to JSON
-data = json.loads(txt_data)
-
-# Convert text to JSON
-data = json.loads(txt_data)
+# Parse the JSON content once, straight from the response bytes
+data = response.json()
 
 mapping = {}
 
@@ -28,12 +22,11 @@ for number, forms in data.items():
             # Split by comma if multiple forms are present
             first_forms = [f.strip() for f in first_form.split(",")]
             
-            # Add each to mapping
+            # Collect every number for each form; joined once below
             for f in first_forms:
-                if f not in mapping:  # Avoid overwriting existing entries
-                    mapping[f] = number
-                else:
-                    mapping[f] += f", {number}"
+                mapping.setdefault(f, []).append(number)
+
+mapping = {form: ", ".join(numbers) for form, numbers in mapping.items()}
 
 # Save mapping to JSON
 with open("output/mapping.json", "w", encoding="utf-8") as f:
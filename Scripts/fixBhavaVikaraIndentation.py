@@ -20,88 +20,102 @@ Instead of:
   - "verb2": null
 """
 
+import os
 import re
 
-def fix_yaml_indentation(input_file, output_file):
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    lines = content.split('\n')
-    fixed_lines = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Sloka line (level 0): starts with " and ends with :
-        if re.match(r'^"[^"]+":\s*$', line):
-            fixed_lines.append(line)
-            i += 1
-            continue
-
-        # Category line (level 1): 2 spaces + "category":
-        if re.match(r'^  "[^"]+":$', line):
-            fixed_lines.append(line)
-            i += 1
-
-            # Process all verbs under this category
-            while i < len(lines):
-                verb_line = lines[i]
+# Verb line patterns, compiled once for every line of every file; they need
+# the verb captured, the simpler checks below use string methods
+_VERB_LIST_RE = re.compile(r'^  - ("[^"]+":)\s*$')
+_VERB_NULL_RE = re.compile(r'^  - ("[^"]+": null)\s*$')
+
+def is_category(line):
+    """2 spaces + "category": and nothing after it"""
+    return (line.startswith('  "') and line.endswith('":')
+            and 3 < line.find('"', 3) == len(line) - 2)
+
+def is_sloka(line):
+    """A line starting with "sloka":"""
+    if not line.startswith('"'):
+        return False
+    close = line.find('"', 1)
+    return close > 1 and line.startswith(':', close + 1)
+
+# Where the previous line left us: at sloka level, among the verbs of a
+# category, or among the values of a verb
+_TOP, _IN_CATEGORY, _IN_VALUES = range(3)
+
+def read_lines(f):
+    """Yield the lines of f without newlines, like content.split('\\n')"""
+    line = ''
+    for line in f:
+        yield line[:-1] if line.endswith('\n') else line
+    if not line or line.endswith('\n'):
+        yield ''
+
+def fix_lines(lines):
+    """Yield each line fixed, in one pass with no lookahead"""
+    state = _TOP
+    for line in lines:
+        # A line that ends a verb or category is read again one level up
+        while True:
+            if state == _IN_VALUES:
+                # Value list item: 4 spaces + - + value
+                if line.startswith('    - '):
+                    # Add 2 more spaces: 6 spaces + - + value
+                    yield '  ' + line
+                    break
+                # Not a value, process it as the next verb
+                state = _IN_CATEGORY
+                continue
 
+            if state == _IN_CATEGORY:
                 # Check if this is a verb line formatted as list item
                 # Pattern: 2 spaces + - + "verb":
-                verb_match = re.match(r'^  - ("[^"]+":)\s*$', verb_line)
+                verb_match = _VERB_LIST_RE.match(line)
                 if verb_match:
                     # Convert to proper mapping: 4 spaces + "verb":
-                    fixed_lines.append('    ' + verb_match.group(1))
-                    i += 1
-
-                    # Process values under this verb
-                    while i < len(lines):
-                        value_line = lines[i]
-
-                        # Value list item: 4 spaces + - + value
-                        if re.match(r'^    - ', value_line):
-                            # Add 2 more spaces: 6 spaces + - + value
-                            fixed_lines.append('  ' + value_line)
-                            i += 1
-                        else:
-                            # Not a value, break to process next verb
-                            break
-                    continue
+                    yield '    ' + verb_match.group(1)
+                    state = _IN_VALUES
+                    break
 
                 # Check if it's a verb with inline null
                 # Pattern: 2 spaces + - + "verb": null
-                verb_null_match = re.match(r'^  - ("[^"]+": null)\s*$', verb_line)
+                verb_null_match = _VERB_NULL_RE.match(line)
                 if verb_null_match:
                     # Convert to proper mapping: 4 spaces + "verb": null
-                    fixed_lines.append('    ' + verb_null_match.group(1))
-                    i += 1
-                    continue
-
-                # If it's another category or sloka, break out
-                if (re.match(r'^  "[^"]+":$', verb_line) or
-                    re.match(r'^"[^"]+":', verb_line)):
+                    yield '    ' + verb_null_match.group(1)
                     break
 
-                # Skip empty lines or add as-is
-                if verb_line.strip() == '':
-                    fixed_lines.append(verb_line)
-                    i += 1
-                else:
-                    # Unknown pattern, keep as-is
-                    fixed_lines.append(verb_line)
-                    i += 1
-                    break
-            continue
+                # If it's another category or sloka, leave the category
+                if is_category(line) or is_sloka(line):
+                    state = _TOP
+                    continue
+
+                # Keep empty lines; an unknown pattern is kept as-is and
+                # ends the category
+                yield line
+                if line.strip() != '':
+                    state = _TOP
+                break
 
-        # Any other line, keep as-is
-        fixed_lines.append(line)
-        i += 1
+            # At sloka level every line is kept as-is; a category line
+            # (2 spaces + "category":) opens its list of verbs
+            if is_category(line):
+                state = _IN_CATEGORY
+            yield line
+            break
 
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(fixed_lines))
+def fix_yaml_indentation(input_file, output_file):
+    # Stream the fixed lines into a temporary file and rename it into place,
+    # so the output can be the input file itself
+    tmp_file = output_file + '.tmp'
+    with open(input_file, 'r', encoding='utf-8') as src, \
+         open(tmp_file, 'w', encoding='utf-8') as dst:
+        separator = ''
+        for line in fix_lines(read_lines(src)):
+            dst.write(separator + line)
+            separator = '\n'
+    os.replace(tmp_file, output_file)
 
     print(f"✓ Fixed YAML written to {output_file}")
 
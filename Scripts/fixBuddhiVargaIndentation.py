@@ -14,64 +14,75 @@ Issues to fix:
 3. Verbs should have proper spacing after "-"
 """
 
-import re
+import os
 
-def fix_buddhivarga_yaml(input_file, output_file):
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    lines = content.split('\n')
-    fixed_lines = []
+def read_lines(f):
+    """Yield the lines of f without newlines, like content.split('\\n')"""
+    line = ''
+    for line in f:
+        yield line[:-1] if line.endswith('\n') else line
+    if not line or line.endswith('\n'):
+        yield ''
 
+def fix_lines(lines):
+    """Yield each line fixed, dispatching on its first character"""
     for line in lines:
-        # Skip empty lines
+        # Keep empty lines
         if line.strip() == '':
-            fixed_lines.append(line)
+            yield line
             continue
 
-        # Sloka lines - keep as is (they should end with ": null")
-        if re.match(r'^"[^"]+":\s*null?\s*$', line):
-            # Ensure it has null at the end
-            if not line.strip().endswith('null'):
-                fixed_lines.append(line.rstrip() + ' null')
-            else:
-                fixed_lines.append(line)
-            continue
+        first = line[0]
 
-        # Quoted category lines - unquote them
-        # Pattern: "category": or "category":
-        match = re.match(r'^"([^"]+)":(\s*)$', line)
-        if match:
-            category = match.group(1)
-            # Unquote and keep at 0 indentation
-            fixed_lines.append(f'{category}:')
-            continue
+        if first == '"':
+            # A quoted key: "text" followed by ':' and the rest of the line
+            close = line.find('"', 1)
+            if close > 1 and line[close + 1:close + 2] == ':':
+                rest = line[close + 2:].strip()
 
-        # Unquoted category lines - keep as is
-        if re.match(r'^[^\s"][^:]*:(\s*)$', line) and not line.strip().startswith('-'):
-            fixed_lines.append(line)
-            continue
+                # Sloka lines - keep as is (they should end with ": null")
+                if rest in ('nul', 'null'):
+                    # Ensure it has null at the end
+                    if rest != 'null':
+                        yield line.rstrip() + ' null'
+                    else:
+                        yield line
+                    continue
 
-        # Verb lines - fix spacing and ensure they end with ":"
-        # Patterns to match:
-        # - "  - verb:" (correct)
-        # - "  - verb" (missing colon)
-        # - "  -verb:" (missing space)
-        # - "  -verb" (missing space and colon)
-        verb_match = re.match(r'^(\s*)-\s*([^:]+):?\s*$', line)
-        if verb_match:
-            indent = verb_match.group(1)
-            verb = verb_match.group(2).strip()
-            # Ensure proper indentation (2 spaces) and format
-            fixed_lines.append(f'  - {verb}:')
-            continue
+                # Quoted category lines - unquote them and keep at 0 indentation
+                if rest == '':
+                    yield f'{line[1:close]}:'
+                    continue
 
-        # Any other line - keep as is
-        fixed_lines.append(line)
+        elif first == '-' or first.isspace():
+            # Verb lines - fix spacing and ensure they end with ":"
+            # Patterns to match:
+            # - "  - verb:" (correct)
+            # - "  - verb" (missing colon)
+            # - "  -verb:" (missing space)
+            # - "  -verb" (missing space and colon)
+            stripped = line.lstrip()
+            if stripped.startswith('-'):
+                verb, _, after_colon = stripped[1:].partition(':')
+                if verb and after_colon.strip() == '':
+                    # Ensure proper indentation (2 spaces) and format
+                    yield f'  - {verb.strip()}:'
+                    continue
 
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(fixed_lines))
+        # Unquoted category lines and any other line - keep as is
+        yield line
+
+def fix_buddhivarga_yaml(input_file, output_file):
+    # Stream the fixed lines into a temporary file and rename it into place,
+    # so the output can be the input file itself
+    tmp_file = output_file + '.tmp'
+    with open(input_file, 'r', encoding='utf-8') as src, \
+         open(tmp_file, 'w', encoding='utf-8') as dst:
+        separator = ''
+        for line in fix_lines(read_lines(src)):
+            dst.write(separator + line)
+            separator = '\n'
+    os.replace(tmp_file, output_file)
 
     print(f"✓ Fixed बुद्धिवर्गः YAML written to {output_file}")
 
@@ -14,7 +14,8 @@ so they become children of the previous shloka.
 
 import os
 import sys
-import glob
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 def fix_yaml_indentation(file_path, dry_run=False):
     """
@@ -33,22 +34,19 @@ def fix_yaml_indentation(file_path, dry_run=False):
     fixed_lines = []
     indented_count = 0
 
-    for i, line in enumerate(lines):
-        stripped = line.lstrip()
-        leading_spaces = len(line) - len(stripped)
-
+    for line in lines:
+        # Blank lines and lines with leading whitespace are already nested;
+        # only a line starting at column 0 is looked at further
+        if not line or line[0].isspace():
+            fixed_lines.append(line)
         # Check if this is a shloka line (ends with ॥":)
-        if line.strip().endswith('॥":'):
+        elif line.rstrip().endswith('॥":'):
             fixed_lines.append(line)
         # Check if this is an artha line that should be indented:
-        # - No leading spaces (column 0)
         # - Not a list item (doesn't start with -)
         # - Not a quoted string (doesn't start with ")
         # - Has a colon (is a key)
-        elif (leading_spaces == 0 and
-              not stripped.startswith('-') and
-              not stripped.startswith('"') and
-              ':' in stripped):
+        elif line[0] != '-' and line[0] != '"' and ':' in line:
             # Indent this line by 2 spaces
             fixed_lines.append('  ' + line)
             indented_count += 1
@@ -62,6 +60,21 @@ def fix_yaml_indentation(file_path, dry_run=False):
 
     return indented_count
 
+def find_yaml_files(folder):
+    """
+    Yield every .yaml file under folder, walking it with os.scandir.
+
+    Hidden files and folders are skipped, as glob's '**' pattern does.
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir():
+                yield from find_yaml_files(entry.path)
+            elif entry.name.endswith('.yaml'):
+                yield entry.path
+
 def fix_all_yaml_files(data_dir, dry_run=False):
     """
     Fix all YAML files in the Data directory.
@@ -71,7 +84,7 @@ def fix_all_yaml_files(data_dir, dry_run=False):
         dry_run: If True, don't write changes, just report
     """
     # Find all YAML files recursively
-    yaml_files = glob.glob(os.path.join(data_dir, '**/*.yaml'), recursive=True)
+    yaml_files = list(find_yaml_files(data_dir))
 
     print(f"Found {len(yaml_files)} YAML files")
     if dry_run:
@@ -81,9 +94,13 @@ def fix_all_yaml_files(data_dir, dry_run=False):
     total_indented = 0
     files_modified = 0
 
-    for yaml_file in yaml_files:
+    # Each file is fixed on its own, so spread them over all cores; map
+    # returns the counts in file order, keeping the report stable
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        counts = list(executor.map(fix_yaml_indentation, yaml_files, repeat(dry_run)))
+
+    for yaml_file, indented in zip(yaml_files, counts):
         rel_path = os.path.relpath(yaml_file, data_dir)
-        indented = fix_yaml_indentation(yaml_file, dry_run=dry_run)
 
         if indented > 0:
             status = "[DRY RUN] Would indent" if dry_run else "Indented"
@@ -3,20 +3,69 @@ import yaml
 import json
 import sys
 import os
+import glob
+import hashlib
+import re
+import functools
+import logging
+
+import _yaml_fast
+from _yaml_fast import FastSafeLoader as _SafeLoader, ForceStringLoader, QuotedDumper
 
 TAB_SPACES = 2
 
-# Load SopasargaMappings (contains all verb forms with upasarga and dhatu information)
-with open("output/SopasargaMappings.json", "r", encoding="utf-8") as f:
-    sopasarga_mapping = json.load(f)
+log = logging.getLogger(__name__)
+
+# Decode JSON with orjson when available (same result as json.load)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Load SopasargaNichMappings (contains verb forms with Nich pratyaya)
-with open("output/SopasargaNichMappings.yaml", "r", encoding="utf-8") as f:
-    sopasarga_nich_mapping = yaml.safe_load(f)
+@functools.lru_cache(maxsize=None)
+def load_mappings():
+    """
+    Load the three mappings on first use. Parsing the San and Nich YAML
+    takes most of a run, so callers that find their result already cached
+    never pay for it.
 
-# Load SopasargaSanMappings (contains verb forms with San pratyaya)
-with open("output/SopasargaSanMappings.yaml", "r", encoding="utf-8") as f:
-    sopasarga_san_mapping = yaml.safe_load(f)
+    Returns:
+        tuple: (sopasarga_mapping, sopasarga_san_mapping, sopasarga_nich_mapping)
+    """
+    # SopasargaMappings (contains all verb forms with upasarga and dhatu information)
+    if orjson:
+        with open("output/SopasargaMappings.json", "rb") as f:
+            sopasarga_mapping = orjson.loads(f.read())
+    else:
+        with open("output/SopasargaMappings.json", "r", encoding="utf-8") as f:
+            sopasarga_mapping = json.load(f)
+
+    # SopasargaSanMappings (contains verb forms with San pratyaya)
+    with open("output/SopasargaSanMappings.yaml", "r", encoding="utf-8") as f:
+        sopasarga_san_mapping = yaml.load(f, Loader=_SafeLoader)
+
+    # SopasargaNichMappings (contains verb forms with Nich pratyaya)
+    with open("output/SopasargaNichMappings.yaml", "r", encoding="utf-8") as f:
+        sopasarga_nich_mapping = yaml.load(f, Loader=_SafeLoader)
+
+    return sopasarga_mapping, sopasarga_san_mapping, sopasarga_nich_mapping
+
+# Fingerprint of everything besides the YAML text that shapes the JSON: the
+# three mappings, this script and the shared YAML loader. A change to any of
+# them invalidates every cached conversion. It only stats the files, so the
+# mappings stay unloaded
+MAPPING_HASH = hashlib.blake2b(repr([
+    (path, os.stat(path).st_size, os.stat(path).st_mtime_ns)
+    for path in ("output/SopasargaMappings.json",
+                 "output/SopasargaNichMappings.yaml",
+                 "output/SopasargaSanMappings.yaml",
+                 os.path.abspath(__file__),
+                 os.path.abspath(_yaml_fast.__file__))
+]).encode('utf-8'), digest_size=16).digest()
+
+# Conversion hashes (and iterateDirectories' pickled vargas) live here, out of
+# the checked-in output folders
+CACHE_DIR = os.path.join("output", ".cache")
 
 def normalize_verb_for_lookup(verb):
     """
@@ -32,6 +81,28 @@ def normalize_verb_for_lookup(verb):
     # Remove (छ) notation and any surrounding whitespace
     return verb.replace('(छ)', '').strip()
 
+@functools.lru_cache(maxsize=None)
+def lookup_sopasarga_mapping(verb):
+    """
+    Look up a verb in sopasarga_mapping. The same forms recur across shlokas
+    and files, so results are cached.
+
+    Returns:
+        tuple: (upasarga, dhatu_id), or None if the verb is not in the mapping.
+            dhatu_id may contain "(More than one)" for multiple matches.
+    """
+    sopasarga_mapping, _, _ = load_mappings()
+    combinations = sopasarga_mapping.get(verb)
+    if combinations is None:
+        return None
+    if len(combinations) == 1:
+        # Single combination
+        combo = combinations[0]
+        return combo['upasarga'], combo['dhatuNumber']
+    # Multiple dhatu IDs with same upasarga
+    upasarga = combinations[0]['upasarga']  # All should have same upasarga
+    return upasarga, deduplicate_and_join_dhatu_ids([c['dhatuNumber'] for c in combinations])
+
 def lookup_san_nich_mapping(verb):
     """
     Look up a verb in San or Nich mappings.
@@ -43,9 +114,11 @@ def lookup_san_nich_mapping(verb):
             - dhatu_id: dhatu number (may contain "(More than one)" for multiple matches)
             - pratyaya: "San" or "Nich" depending on which mapping it was found in
     """
+    _, sopasarga_san_mapping, sopasarga_nich_mapping = load_mappings()
+
     # Check San mapping first
-    if verb in sopasarga_san_mapping:
-        combinations = sopasarga_san_mapping[verb]
+    combinations = sopasarga_san_mapping.get(verb)
+    if combinations is not None:
         if len(combinations) == 1:
             combo = combinations[0]
             return True, combo['upasarga'], combo['dhatuNumber'], "San"
@@ -56,8 +129,8 @@ def lookup_san_nich_mapping(verb):
             return True, upasarga, dhatu_ids, "San"
 
     # Check Nich mapping
-    if verb in sopasarga_nich_mapping:
-        combinations = sopasarga_nich_mapping[verb]
+    combinations = sopasarga_nich_mapping.get(verb)
+    if combinations is not None:
         if len(combinations) == 1:
             combo = combinations[0]
             return True, combo['upasarga'], combo['dhatuNumber'], "Nich"
@@ -70,6 +143,13 @@ def lookup_san_nich_mapping(verb):
     # Not found in either mapping
     return False, "", "Not Found", ""
 
+def looks_like_dhatu_id(item):
+    """
+    True if item has the shape of a dhatu_id (format: XX.XXXX): a dot and at
+    least one digit.
+    """
+    return '.' in item and any(map(str.isdigit, item))
+
 def deduplicate_and_join_dhatu_ids(dhatu_ids_list):
     """
     Remove duplicate dhatu_ids from a list and join them with ", ".
@@ -106,94 +186,72 @@ def deduplicate_and_join_dhatu_ids(dhatu_ids_list):
         return ", ".join(unique_ids) + " (More than one)"
 
 # -------------------------
-# Custom YAML dumper to preserve strings
-class QuotedDumper(yaml.SafeDumper):
-    pass
-
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
-
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-
-def update_nulls_with_mapping(node):
+def mapping_value(key):
+    """
+    Return the value for a null verb from sopasarga_mapping, or None if the
+    verb is not in the mapping.
+    """
+    found = lookup_sopasarga_mapping(key)
+    if found is None:
+        return None
+    upasarga, dhatu_ids = found
+    value = [upasarga, dhatu_ids] if upasarga else [dhatu_ids]
+    # One line per updated verb; only formatted when someone is listening
+    if log.isEnabledFor(logging.INFO):
+        log.info("🔄 Updating '%s' → [%s]", key, ", ".join(value))
+    return value
+
+def update_nulls_with_mapping(root):
     """
-    Recursively update list elements or nulls using sopasarga_mapping.
+    Update nulls anywhere under root using sopasarga_mapping.
     The sopasarga_mapping contains all verb forms with their upasarga and dhatu information.
     For verbs without upasarga, the upasarga field will be empty string.
+
+    Nodes are walked with an explicit stack, visiting each one once.
     """
-    if isinstance(node, dict):
-        for key, value in node.items():
-            if isinstance(value, (dict, list)):
-                update_nulls_with_mapping(value)
-            elif value is None:
-                # Check sopasarga_mapping for verb forms
-                if key in sopasarga_mapping:
-                    # Get all possible combinations from sopasarga mapping
-                    combinations = sopasarga_mapping[key]
-                    if len(combinations) == 1:
-                        # Single combination - use it directly
-                        combo = combinations[0]
-                        if combo['upasarga']:
-                            print(f"🔄 Updating '{key}' → [{combo['upasarga']}, {combo['dhatuNumber']}]")
-                            node[key] = [combo['upasarga'], combo['dhatuNumber']]
-                        else:
-                            print(f"🔄 Updating '{key}' → [{combo['dhatuNumber']}]")
-                            node[key] = [combo['dhatuNumber']]
-                    else:
-                        # Multiple combinations - use dhatu_ids separated by comma (deduplicated)
-                        dhatu_ids = deduplicate_and_join_dhatu_ids([c['dhatuNumber'] for c in combinations])
-                        upasarga = combinations[0]['upasarga']  # All should have same upasarga
-                        if upasarga:
-                            print(f"🔄 Updating '{key}' → [{upasarga}, {dhatu_ids}]")
-                            node[key] = [upasarga, dhatu_ids]
-                        else:
-                            print(f"🔄 Updating '{key}' → [{dhatu_ids}]")
-                            node[key] = [dhatu_ids]
-
-    elif isinstance(node, list):
-        for item in node:
-            if isinstance(item, dict):
-                for k, v in item.items():
-                    # Case: - वेत्ति:
-                    if v is None:
-                        # Check sopasarga_mapping
-                        if k in sopasarga_mapping:
-                            combinations = sopasarga_mapping[k]
-                            if len(combinations) == 1:
-                                combo = combinations[0]
-                                if combo['upasarga']:
-                                    print(f"🔄 Updating '{k}' → [{combo['upasarga']}, {combo['dhatuNumber']}]")
-                                    item[k] = [combo['upasarga'], combo['dhatuNumber']]
-                                else:
-                                    print(f"🔄 Updating '{k}' → [{combo['dhatuNumber']}]")
-                                    item[k] = [combo['dhatuNumber']]
-                            else:
-                                dhatu_ids = deduplicate_and_join_dhatu_ids([c['dhatuNumber'] for c in combinations])
-                                upasarga = combinations[0]['upasarga']
-                                if upasarga:
-                                    print(f"🔄 Updating '{k}' → [{upasarga}, {dhatu_ids}]")
-                                    item[k] = [upasarga, dhatu_ids]
-                                else:
-                                    print(f"🔄 Updating '{k}' → [{dhatu_ids}]")
-                                    item[k] = [dhatu_ids]
-                    elif isinstance(v, (dict, list)):
-                        update_nulls_with_mapping(v)
-            else:
-                update_nulls_with_mapping(item)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                # Case: - वेत्ति:
+                if value is None:
+                    new_value = mapping_value(key)
+                    if new_value is not None:
+                        node[key] = new_value
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
 
                 
 # -------------------------
-# Custom loader to force all scalars to strings
-class ForceStringLoader(yaml.SafeLoader):
-    pass
+# Line rules for fix_yaml_indentation_in_memory. Each one starts with the
+# newline before its line, a literal the regex engine can scan for quickly,
+# and puts it back in the replacement. "Column 0" means the line does not
+# start with whitespace; [^\S\n] is whitespace within a line
+_NOT_SHLOKA = r'(?![^\n]*॥":[^\S\n]*$)'
 
-def str_constructor(loader, node):
-    return loader.construct_scalar(node)
+# Parent verb at column 0 followed by child verbs at indent 2 (both ending
+# with a colon); the groups hold the parent line and the child lines
+_NESTED_VERBS_RE = re.compile(r'\n(-[^\n]*(?<!॥"):)((?:\n[^\S\n]{2}-[^\n]*:[^\S\n]*$)+)', re.M)
 
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:int', str_constructor)
-ForceStringLoader.add_constructor(u'tag:yaml.org,2002:float', str_constructor)
+# Shloka line ending with ": null"
+_SHLOKA_NULL_RE = re.compile(r'\n[^\n]*॥": null[^\S\n]*$', re.M)
+
+# Artha key at column 0: not a list item, ends with a colon
+_ARTHA_RE = re.compile(r'\n(?=[^\s-][^\n]*(?<!॥"):$)', re.M)
+
+# Verb list item at column 0
+_VERB_RE = re.compile(r'\n(?=-)' + _NOT_SHLOKA, re.M)
+
+# Dhatu_id list item already indented by 2
+_DHATU_ID_RE = re.compile(r'\n(?=[^\S\n]{2}-)' + _NOT_SHLOKA, re.M)
+
+def _remove_null(match):
+    # Remove " null" to allow artha children
+    return match.group(0).replace(': null', ':')
 
-# -------------------------
 def fix_yaml_indentation_in_memory(raw_text):
     """
     Fix YAML indentation issue where artha categories are not properly nested under shloka text.
@@ -220,90 +278,38 @@ def fix_yaml_indentation_in_memory(raw_text):
 
     Returns fixed text.
     """
-    lines = raw_text.split('\n')
-    fixed_lines = []
+    # Each rule is a multiline regex applied to the whole text, so lines that
+    # need no change never reach Python code. A shloka line (ending in ॥":,
+    # with or without null) is never indented, hence the lookaheads. Nested
+    # verbs go first: a child verb ending in ॥": null ends the nesting even
+    # though its null is removed
     indented_count = 0
-    removed_null_count = 0
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.lstrip()
-        leading_spaces = len(line) - len(stripped)
-
-        # Check if this is a shloka line (ends with ॥":)
-        if line.strip().endswith('॥": null') or line.strip().endswith('॥":'):
-            # Remove " null" if present to allow artha children
-            if line.strip().endswith('॥": null'):
-                line = line.replace(': null', ':')
-                removed_null_count += 1
-            fixed_lines.append(line)
-            i += 1
-        # Check if this is an artha line that should be indented:
-        # - No leading spaces (column 0)
-        # - Not a list item (doesn't start with -)
-        # - Ends with a colon (is a key)
-        # - Not a shloka line
-        elif (leading_spaces == 0 and
-              not stripped.startswith('-') and
-              stripped.endswith(':') and
-              not stripped.endswith('॥":')):
-            # Indent artha by 2 spaces (under shloka)
-            fixed_lines.append('  ' + line)
-            indented_count += 1
-            i += 1
-        # Check if this is a parent verb at column 0 with nested child verbs
-        elif leading_spaces == 0 and stripped.startswith('-') and stripped.endswith(':'):
-            # Check if next line is a nested child verb (indent 2, starts with -, ends with :)
-            # vs a dhatu_id (indent 2, starts with -, does NOT end with :)
-            if (i + 1 < len(lines) and
-                lines[i + 1].lstrip().startswith('-') and
-                len(lines[i + 1]) - len(lines[i + 1].lstrip()) == 2 and
-                lines[i + 1].rstrip().endswith(':')):
-                # This is a nested verb structure - flatten it
-                # Add the parent verb as a regular verb
-                fixed_lines.append('    ' + line)
-                indented_count += 1
-                i += 1
-
-                # Add all child verbs as siblings (not nested) by removing one level of indentation
-                while (i < len(lines) and
-                       lines[i].lstrip().startswith('-') and
-                       len(lines[i]) - len(lines[i].lstrip()) == 2 and
-                       lines[i].rstrip().endswith(':')):
-                    # Child verb at indent 2 - make it indent 0, then add 4 spaces
-                    # Remove 2 spaces of indentation, then add 4
-                    child_verb = lines[i][2:]  # Remove first 2 spaces
-                    fixed_lines.append('    ' + child_verb)
-                    indented_count += 1
-                    i += 1
-            else:
-                # Regular verb at column 0 without nested child verbs (may have dhatu_ids as children)
-                fixed_lines.append('    ' + line)
-                indented_count += 1
-                i += 1
-        # Check if this is a verb list item at column 0 (no children)
-        elif leading_spaces == 0 and stripped.startswith('-'):
-            # Indent verb list items by 4 spaces (2 + 2, under artha)
-            fixed_lines.append('    ' + line)
-            indented_count += 1
-            i += 1
-        # Check if this is a dhatu_id list item already indented by 2
-        elif leading_spaces == 2 and stripped.startswith('-'):
-            # This is already at indent 2, needs to be at indent 6 (4 + 2)
-            fixed_lines.append('    ' + line)
-            indented_count += 1
-            i += 1
-        else:
-            fixed_lines.append(line)
-            i += 1
+
+    def flatten_nested_verbs(match):
+        # Add the parent verb as a regular verb, and the child verbs as
+        # siblings: remove 2 spaces of indentation from each, then add 4
+        nonlocal indented_count
+        children = match.group(2).split('\n')[1:]
+        indented_count += 1 + len(children)
+        return '\n    ' + match.group(1) + ''.join('\n    ' + child[2:] for child in children)
+
+    # A leading newline lets the rules match the first line too
+    text = _NESTED_VERBS_RE.sub(flatten_nested_verbs, '\n' + raw_text)
+    text, removed_null_count = _SHLOKA_NULL_RE.subn(_remove_null, text)
+    text, count = _ARTHA_RE.subn('\n  ', text)
+    indented_count += count
+    text, count = _VERB_RE.subn('\n    ', text)
+    indented_count += count
+    text, count = _DHATU_ID_RE.subn('\n    ', text)
+    indented_count += count
+    text = text[1:]
 
     if indented_count > 0:
         print(f"🔧 Fixed {indented_count} indentation issue(s) in YAML")
     if removed_null_count > 0:
         print(f"🔧 Removed {removed_null_count} 'null' value(s) from shloka lines")
 
-    return '\n'.join(fixed_lines)
+    return text
 
 def load_yaml_clean_tabs(yaml_file):
     """Load YAML and replace tabs with spaces."""
@@ -338,7 +344,167 @@ def write_clean_yaml(data, yaml_file):
         )
 
 # -------------------------
-def yaml_to_json(yaml_file, varga_name=None, prevCnt=0 ):
+def intern(value):
+    """
+    Intern a string value. Artha, gati and dhatu_id values repeat across many
+    entries; interning lets those entries share one string each. A YAML key
+    can still load as a bool or None, which is returned as-is.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+def nanartha_verb_blocks(verbs_data):
+    """Yield the verb blocks of one Nanartha Varga shloka"""
+    # Special handling for Nanartha Varga: interchange form and artha
+    # In Nanartha Varga:
+    # Original structure: भवति: [सत्तायाम्:, ...]
+    # We need to treat: form=भवति, artha=सत्तायाम्
+    # So each "artha" key becomes a "form", and each entry becomes an "artha"
+    for form_text, artha_list in verbs_data.items():
+        if not artha_list:
+            continue
+
+        # artha_list should be a list of dicts like [{'सत्तायाम्': None}, ...]
+        if isinstance(artha_list, list):
+            for artha_item in artha_list:
+                if isinstance(artha_item, dict):
+                    for artha_text, metadata in artha_item.items():
+                        # Now we need to split the form_text to extract upasarga and dhatu
+                        form = form_text
+                        dhatu_id, upasagra, pratyaya = "Not Found", "", ""
+
+                        # Try to look up in sopasarga_mapping (normalize to remove (छ) notation)
+                        normalized_form = normalize_verb_for_lookup(form)
+                        found = lookup_sopasarga_mapping(normalized_form)
+                        if found is not None:
+                            upasagra, dhatu_id = found
+                        else:
+                            # Not found in SopasargaMappings, check San/Nich mappings
+                            _, upasagra, dhatu_id, pratyaya = lookup_san_nich_mapping(normalized_form)
+
+                        # Build entry dict
+                        entry_dict = {
+                            "form": form,
+                            "dhatu_id": intern(dhatu_id),
+                            "gati": intern(upasagra)
+                        }
+                        if pratyaya:
+                            entry_dict["pratyaya"] = pratyaya
+
+                        # Create a verb block for each artha
+                        yield {"artha": intern(artha_text), "entries": [entry_dict]}
+
+def verb_entry(verb, metaData):
+    """Return the entry of one verb in a non-Nanartha Varga shloka"""
+    form = verb
+    dhatu_id, upasagra, pratyaya = "Not Found", "", ""
+
+    # Normalize metaData to a list
+    if not metaData or metaData == "":
+        data_list = []
+    elif isinstance(metaData, list):
+        data_list = metaData
+    elif isinstance(metaData, str):
+        data_list = [metaData]
+    else:
+        data_list = []
+
+    # Filter out empty strings and None values, stripping each
+    # item once here
+    valid_data = [stripped for stripped in
+                  (item.strip() for item in data_list if isinstance(item, str))
+                  if stripped]
+
+    if len(valid_data) == 0:
+        # No valid data - check sopasarga_mapping (normalize to remove (छ) notation)
+        normalized_verb = normalize_verb_for_lookup(verb)
+        found = lookup_sopasarga_mapping(normalized_verb)
+        if found is not None:
+            upasagra, dhatu_id = found
+        else:
+            # Not found in SopasargaMappings, check San/Nich mappings
+            _, upasagra, dhatu_id, pratyaya = lookup_san_nich_mapping(normalized_verb)
+    elif len(valid_data) == 1:
+        # Single item - could be dhatu_id or gati
+        item = valid_data[0]
+        # Check if it looks like a dhatu_id (format: XX.XXXX or contains comma-separated IDs)
+        if ',' in item:
+            # Multiple dhatu_ids separated by comma - deduplicate them
+            # deduplicate_and_join_dhatu_ids strips each id itself
+            dhatu_id = deduplicate_and_join_dhatu_ids(item.split(','))
+        elif looks_like_dhatu_id(item):
+            dhatu_id = item
+        else:
+            # It's probably a gati (upasarga) without dhatu_id
+            upasagra = item
+            dhatu_id = "Not Found"
+    elif len(valid_data) == 2:
+        # Two items - first is gati, second is dhatu_id
+        upasagra = valid_data[0]
+        second_item = valid_data[1]
+        # Check if second item has comma-separated dhatu_ids
+        if ',' in second_item:
+            # deduplicate_and_join_dhatu_ids strips each id itself
+            dhatu_id = deduplicate_and_join_dhatu_ids(second_item.split(','))
+        else:
+            dhatu_id = second_item
+    else:
+        # More than 2 items - check if multiple dhatu_ids
+        # First item might be gati, rest are dhatu_ids
+        possible_gati = valid_data[0]
+        dhatu_ids = []
+
+        # Check if first item is a gati (not a dhatu_id)
+        if not looks_like_dhatu_id(possible_gati):
+            upasagra = possible_gati
+            dhatu_ids = valid_data[1:]
+        else:
+            dhatu_ids = valid_data
+
+        # Handle multiple dhatu_ids (deduplicate)
+        dhatu_id = deduplicate_and_join_dhatu_ids(dhatu_ids)
+
+    # Build entry dict
+    entry_dict = {
+        "form": form,
+        "dhatu_id": intern(dhatu_id),
+        "gati": intern(upasagra)
+    }
+    if pratyaya:
+        entry_dict["pratyaya"] = pratyaya
+    return entry_dict
+
+def verb_blocks(verbs_data):
+    """Yield the verb blocks of one shloka"""
+    # Normal processing for non-Nanartha Varga
+    for artha, entries in verbs_data.items():
+        if not entries:
+            continue
+        # If verb_items is a list of single-key dicts, merge into one dict
+        if isinstance(entries, list):
+            merged_entries = {}
+            merge = merged_entries.update
+            # The loader only builds plain dicts and strs, so exact
+            # type checks suffice
+            for item in entries:
+                item_type = type(item)
+                if item_type is dict:
+                    merge(item)
+                elif item_type is str:
+                    # Handle simple string verbs if needed
+                    merged_entries[item] = ""
+            entries_dict = merged_entries
+        elif isinstance(entries, dict):
+            entries_dict = entries
+        else:
+            entries_dict = {}
+
+        yield {
+            "artha": intern(artha),
+            "entries": [verb_entry(verb, metaData) for verb, metaData in entries_dict.items()]
+        }
+
+def iter_shlokas(yaml_file, varga_name=None, prevCnt=0):
+    """Yield the JSON entry of each shloka in yaml_file, one at a time."""
     # 1️⃣ Load YAML and clean tabs
     data = load_yaml_clean_tabs(yaml_file)
 
@@ -348,12 +514,12 @@ def yaml_to_json(yaml_file, varga_name=None, prevCnt=0 ):
 
     # update_nulls_with_mapping( data )
 
-    # Detect if this is a Nanartha Varga file
+    # Detect if this is a Nanartha Varga file, and pick its verb conversion once
     is_nanartha = 'नानार्थवर्गः' in yaml_file or 'nanartha' in yaml_file.lower()
+    convert_verbs = nanartha_verb_blocks if is_nanartha else verb_blocks
 
     # print(exclude_lines)
     # 5️⃣ Convert to JSON structure
-    shlokas_list = []
     shloka_num = prevCnt + 1
     for shloka_text, verbs_data in data.items():
         
@@ -378,175 +544,81 @@ def yaml_to_json(yaml_file, varga_name=None, prevCnt=0 ):
             verbs_data = {"": verbs_data}
         # print(type(verbs_data))
 
-        # Special handling for Nanartha Varga: interchange form and artha
-        if is_nanartha:
-            # In Nanartha Varga:
-            # Original structure: भवति: [सत्तायाम्:, ...]
-            # We need to treat: form=भवति, artha=सत्तायाम्
-            # So each "artha" key becomes a "form", and each entry becomes an "artha"
-            for form_text, artha_list in verbs_data.items():
-                if not artha_list:
-                    continue
-
-                # artha_list should be a list of dicts like [{'सत्तायाम्': None}, ...]
-                if isinstance(artha_list, list):
-                    for artha_item in artha_list:
-                        if isinstance(artha_item, dict):
-                            for artha_text, metadata in artha_item.items():
-                                # Create a verb block for each artha
-                                verb_block = {"artha": artha_text, "entries": []}
-
-                                # Now we need to split the form_text to extract upasarga and dhatu
-                                form = form_text
-                                dhatu_id, upasagra, pratyaya = "Not Found", "", ""
-
-                                # Try to look up in sopasarga_mapping (normalize to remove (छ) notation)
-                                normalized_form = normalize_verb_for_lookup(form)
-                                if normalized_form in sopasarga_mapping:
-                                    combinations = sopasarga_mapping[normalized_form]
-                                    if len(combinations) == 1:
-                                        # Single combination
-                                        combo = combinations[0]
-                                        upasagra = combo['upasarga']
-                                        dhatu_id = combo['dhatuNumber']
-                                    else:
-                                        # Multiple dhatu IDs with same upasarga
-                                        upasagra = combinations[0]['upasarga']
-                                        dhatu_id = deduplicate_and_join_dhatu_ids([c['dhatuNumber'] for c in combinations])
-                                else:
-                                    # Not found in SopasargaMappings, check San/Nich mappings
-                                    _, upasagra, dhatu_id, pratyaya = lookup_san_nich_mapping(normalized_form)
-
-                                # Build entry dict
-                                entry_dict = {
-                                    "form": form,
-                                    "dhatu_id": dhatu_id,
-                                    "gati": upasagra
-                                }
-                                if pratyaya:
-                                    entry_dict["pratyaya"] = pratyaya
-
-                                verb_block["entries"].append(entry_dict)
-
-                                shloka_entry["verbs"].append(verb_block)
-        else:
-            # Normal processing for non-Nanartha Varga
-            for artha, entries in verbs_data.items():
-                verb_block = {"artha": artha, "entries": []}
-
-                if not entries:
-                    continue
-                # If verb_items is a list of single-key dicts, merge into one dict
-                if isinstance(entries, list):
-                    merged_entries = {}
-                    for item in entries:
-                        if isinstance(item, dict):
-                            merged_entries.update(item)
-                        elif isinstance(item, str):
-                            # Handle simple string verbs if needed
-                            merged_entries[item] = ""
-                    entries_dict = merged_entries
-                elif isinstance(entries, dict):
-                    entries_dict = entries
-                else:
-                    entries_dict = {}
-
-                for verb, metaData in entries_dict.items():
-                    form = verb
-                    dhatu_id, upasagra, pratyaya = "Not Found", "", ""
-
-                    # Normalize metaData to a list
-                    if not metaData or metaData == "":
-                        data_list = []
-                    elif isinstance(metaData, list):
-                        data_list = metaData
-                    elif isinstance(metaData, str):
-                        data_list = [metaData]
-                    else:
-                        data_list = []
-
-                    # Filter out empty strings and None values
-                    valid_data = [item for item in data_list if item and isinstance(item, str) and item.strip()]
-
-                    if len(valid_data) == 0:
-                        # No valid data - check sopasarga_mapping (normalize to remove (छ) notation)
-                        normalized_verb = normalize_verb_for_lookup(verb)
-                        if normalized_verb in sopasarga_mapping:
-                            combinations = sopasarga_mapping[normalized_verb]
-                            if len(combinations) == 1:
-                                # Single combination
-                                combo = combinations[0]
-                                upasagra = combo['upasarga']
-                                dhatu_id = combo['dhatuNumber']
-                            else:
-                                # Multiple dhatu IDs with same upasarga
-                                upasagra = combinations[0]['upasarga']  # All should have same upasarga
-                                dhatu_id = deduplicate_and_join_dhatu_ids([c['dhatuNumber'] for c in combinations])
-                        else:
-                            # Not found in SopasargaMappings, check San/Nich mappings
-                            _, upasagra, dhatu_id, pratyaya = lookup_san_nich_mapping(normalized_verb)
-                    elif len(valid_data) == 1:
-                        # Single item - could be dhatu_id or gati
-                        item = valid_data[0].strip()
-                        # Check if it looks like a dhatu_id (format: XX.XXXX or contains comma-separated IDs)
-                        if ',' in item:
-                            # Multiple dhatu_ids separated by comma - deduplicate them
-                            dhatu_ids_list = [d.strip() for d in item.split(',')]
-                            dhatu_id = deduplicate_and_join_dhatu_ids(dhatu_ids_list)
-                        elif '.' in item and any(c.isdigit() for c in item):
-                            dhatu_id = item
-                        else:
-                            # It's probably a gati (upasarga) without dhatu_id
-                            upasagra = item
-                            dhatu_id = "Not Found"
-                    elif len(valid_data) == 2:
-                        # Two items - first is gati, second is dhatu_id
-                        upasagra = valid_data[0].strip()
-                        second_item = valid_data[1].strip()
-                        # Check if second item has comma-separated dhatu_ids
-                        if ',' in second_item:
-                            dhatu_ids_list = [d.strip() for d in second_item.split(',')]
-                            dhatu_id = deduplicate_and_join_dhatu_ids(dhatu_ids_list)
-                        else:
-                            dhatu_id = second_item
-                    else:
-                        # More than 2 items - check if multiple dhatu_ids
-                        # First item might be gati, rest are dhatu_ids
-                        possible_gati = valid_data[0].strip()
-                        dhatu_ids = []
-
-                        # Check if first item is a gati (not a dhatu_id)
-                        if '.' not in possible_gati or not any(c.isdigit() for c in possible_gati):
-                            upasagra = possible_gati
-                            dhatu_ids = [item.strip() for item in valid_data[1:]]
-                        else:
-                            dhatu_ids = [item.strip() for item in valid_data]
-
-                        # Handle multiple dhatu_ids (deduplicate)
-                        dhatu_id = deduplicate_and_join_dhatu_ids(dhatu_ids)
+        shloka_entry["verbs"].extend(convert_verbs(verbs_data))
 
-                    # Build entry dict
-                    entry_dict = {
-                        "form": form,
-                        "dhatu_id": dhatu_id,
-                        "gati": upasagra
-                    }
-                    if pratyaya:
-                        entry_dict["pratyaya"] = pratyaya
+        yield shloka_entry
+        shloka_num += 1  # only incremented for non-excluded shlokas
 
-                    verb_block["entries"].append(entry_dict)
+def yaml_to_json(yaml_file, varga_name=None, prevCnt=0 ):
+    return {"shlokas": list(iter_shlokas(yaml_file, varga_name, prevCnt))}
 
-                shloka_entry["verbs"].append(verb_block)
+def write_shlokas_json(shlokas, output_json):
+    """
+    Write {"shlokas": [...]} to output_json one shloka at a time, so neither
+    the whole list nor its encoded text is held in memory. The text is the
+    same as json.dumps(..., ensure_ascii=False, indent=4) of the full dict.
+    It goes to a temporary file first, so a failed conversion leaves any
+    earlier output_json untouched.
+    """
+    tmp_json = output_json + '.tmp'
+    try:
+        with open(tmp_json, 'w', encoding='utf-8') as out:
+            out.write('{\n    "shlokas": [')
+            count = 0
+            for shloka_entry in shlokas:
+                # Each entry sits two levels deep in the indented document
+                text = json.dumps(shloka_entry, ensure_ascii=False, indent=4)
+                out.write((',\n        ' if count else '\n        ') + text.replace('\n', '\n        '))
+                count += 1
+            out.write('\n    ]\n}' if count else ']\n}')
+    except BaseException:
+        os.remove(tmp_json)
+        raise
+    os.replace(tmp_json, output_json)
 
-        shlokas_list.append(shloka_entry)
-        shloka_num += 1  # only incremented for non-excluded shlokas
+def convert_file(yaml_file, output_json):
+    """
+    Write output_json from yaml_file, unless the YAML and the mappings are
+    unchanged since output_json was last written. A hash of them is kept in
+    CACHE_DIR, in a file named after output_json's path.
 
-    return {"shlokas": shlokas_list}
+    Returns True if the JSON was written, False if it was already up to date.
+    """
+    with open(yaml_file, 'rb') as f:
+        digest = hashlib.blake2b(f.read() + MAPPING_HASH, digest_size=16).hexdigest()
+
+    output_key = os.path.abspath(output_json).encode('utf-8')
+    hash_file = os.path.join(CACHE_DIR, hashlib.blake2b(output_key, digest_size=16).hexdigest() + '.hash')
+    if os.path.exists(output_json) and os.path.exists(hash_file):
+        with open(hash_file, 'r', encoding='utf-8') as f:
+            if f.read() == digest:
+                return False
+
+    write_shlokas_json(iter_shlokas(yaml_file), output_json)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(hash_file, 'w', encoding='utf-8') as f:
+        f.write(digest)
+    return True
+
+def convert_directory(input_dir, output_dir):
+    """
+    Convert every YAML file under input_dir in this one process, so the
+    mappings are loaded once for the whole run. Each JSON file mirrors the
+    YAML file's path relative to input_dir.
+    """
+    yaml_files = sorted(glob.glob(os.path.join(input_dir, '**', '*.yaml'), recursive=True))
+    for yaml_file in yaml_files:
+        output_json = os.path.join(output_dir, os.path.relpath(yaml_file, input_dir))
+        output_json = os.path.splitext(output_json)[0] + '.json'
+        os.makedirs(os.path.dirname(output_json), exist_ok=True)
+        convert_file(yaml_file, output_json)
+    return len(yaml_files)
 
 # -------------------------
 if __name__ == "__main__":
     if len(sys.argv) != 3:
         print("Usage: python3 generateSlokas.py input/sampleFile.yaml output/testSlokas_Autogenerated.json")
+        print("   or: python3 generateSlokas.py input_dir/ output_dir/")
         sys.exit(1)
 
     input_yaml = sys.argv[1]
@@ -556,9 +628,13 @@ if __name__ == "__main__":
         print(f"Error: {input_yaml} does not exist")
         sys.exit(1)
 
-    slokasPerVarga = yaml_to_json(input_yaml)
+    if os.path.isdir(input_yaml):
+        count = convert_directory(input_yaml, output_json)
+        print(f"✅ {count} JSON file(s) written to {output_json}")
+        sys.exit(0)
 
-    with open(output_json, 'w', encoding='utf-8') as out:
-        json.dump(slokasPerVarga, out, ensure_ascii=False, indent=4)
+    if not convert_file(input_yaml, output_json):
+        print(f"✅ {output_json} is already up to date")
+        sys.exit(0)
 
     print(f"✅ JSON written to {output_json} and YAML cleaned in-place!")
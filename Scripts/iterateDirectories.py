@@ -3,7 +3,59 @@ import yaml
 import json
 import os
 import sys
-from generateSlokas import yaml_to_json
+import pickle
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from generateSlokas import yaml_to_json, MAPPING_HASH, CACHE_DIR
+
+# Serialize compact output with orjson when available (same bytes as json.dumps)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BOOK_NAME = "आख्यातचन्द्रिका"
+
+# Converted vargas are pickled in CACHE_DIR, keyed on the YAML file's path,
+# mtime and size, so an unchanged file is not parsed again on the next run
+_used_cache_files = set()
+
+# ------------------------------
+# Function to convert a varga YAML file, reusing the cached result if the file is unchanged.
+# Runs in a worker process, so it returns the cache file for the parent to record
+# ------------------------------
+def convert_varga(job):
+    yaml_file, varga_name = job
+    st = os.stat(yaml_file)
+    key = f"{os.path.abspath(yaml_file)}:{st.st_mtime_ns}:{st.st_size}:{varga_name}"
+    digest = hashlib.blake2b(key.encode('utf-8') + MAPPING_HASH, digest_size=16).hexdigest()
+    cache_file = os.path.join(CACHE_DIR, digest + '.pkl')
+
+    try:
+        with open(cache_file, 'rb') as f:
+            return cache_file, pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    shlokas = yaml_to_json(yaml_file, varga_name)["shlokas"]
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(shlokas, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+    return cache_file, shlokas
+
+# ------------------------------
+# Function to remove cached vargas that this run did not use. Other files in
+# the cache (generateSlokas' conversion hashes) are left alone
+# ------------------------------
+def prune_cache():
+    if not os.path.isdir(CACHE_DIR):
+        return
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.hash') and entry.path not in _used_cache_files:
+                os.remove(entry.path)
 
 # ------------------------------
 # Function to read mangalam from mangalam.yaml in a Kanda folder
@@ -20,92 +72,172 @@ def read_mangalam(kanda_folder):
 # ------------------------------
 # Function to extract vargas for a given Kanda folder
 # ------------------------------
-def extract_varga_data(varga_folder):
-    vargas = []
-    for file_name in sorted(os.listdir(varga_folder)):
-        # print( os.listdir(varga_folder) )
+def extract_varga_data(varga_folder, executor):
+    # Lay out the vargas first, collecting every YAML file to convert, so the
+    # files can be converted in parallel
+    layout = []
+    jobs = []
+    # scandir's entries know their path and type from the directory read,
+    # saving a stat() per entry
+    with os.scandir(varga_folder) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        file_name = entry.name
         if file_name.endswith('.yaml') and file_name != 'mangalam.yaml':
-            varga_id = int(file_name.split('_')[0])
-            varga_name = '_'.join(file_name.split('_')[1:]).replace('.yaml','')
-            yaml_file = os.path.join(varga_folder, file_name)
-            shlokas_json = yaml_to_json(yaml_file)
-            vargas.append({
-                "varga_id": str(varga_id),
-                "varga_name": varga_name,
-                "shlokas": shlokas_json["shlokas"]
-            })
+            head, _, tail = file_name.partition('_')
+            varga_id = int(head)
+            varga_name = tail.replace('.yaml','')
+            yaml_file = entry.path
+            layout.append((str(varga_id), varga_name, None, [len(jobs)]))
+            jobs.append((yaml_file, None))
         else:
-            subVargas = []
-            subKhandaPath = os.path.join(varga_folder, file_name)
-            if os.path.isdir(subKhandaPath):
-                varga_id = str( file_name.split('_')[0] )
-                varga_name = "_".join(file_name.split('_')[1:])
+            subKhandaPath = entry.path
+            if entry.is_dir():
+                varga_id, _, varga_name = file_name.partition('_')
                 mangalam_lines = ""
                 tmp_dict = {}
-                for file_name in sorted( os.listdir( subKhandaPath ) ):
+                with os.scandir( subKhandaPath ) as it:
+                    sub_entries = sorted(it, key=lambda entry: entry.name)
+                for sub_entry in sub_entries:
+                    file_name = sub_entry.name
                     if file_name == 'mangalam.yaml':
                         mangalam_lines = read_mangalam( subKhandaPath )
                     elif file_name.endswith('.yaml'):
-                        yaml_file = os.path.join(subKhandaPath, file_name)
-                        sub_varga_id = int(file_name.split('_')[0])
-                        sub_varga_name = '_'.join(file_name.split('_')[1:]).replace('.yaml','')
+                        yaml_file = sub_entry.path
+                        head, _, tail = file_name.partition('_')
+                        sub_varga_id = int(head)
+                        sub_varga_name = tail.replace('.yaml','')
                         tmp_dict[ sub_varga_id ] = [ sub_varga_name, yaml_file ]
                 tmp_dict = dict(sorted(tmp_dict.items()))
-                prevCnt = 0
+                job_indexes = []
                 for val in tmp_dict.values():
-                    shlokas_json = yaml_to_json(val[1], val[0], prevCnt )["shlokas"]
-                    prevCnt = len( shlokas_json ) + prevCnt
-                    for item in shlokas_json:
-                        subVargas.append(item)
-                vargas.append({
-                    "varga_id": str(varga_id),
-                    "varga_name": varga_name,
-                    "mangalam": mangalam_lines,
-                    "shlokas": subVargas
-                })
-                # vargas.append( subVargas)
+                    job_indexes.append(len(jobs))
+                    jobs.append((val[1], val[0]))
+                layout.append((varga_id, varga_name, mangalam_lines, job_indexes))
+
+    results = list(executor.map(convert_varga, jobs))
+    _used_cache_files.update(cache_file for cache_file, _ in results)
+
+    vargas = []
+    for varga_id, varga_name, mangalam_lines, job_indexes in layout:
+        if mangalam_lines is None:
+            vargas.append({
+                "varga_id": varga_id,
+                "varga_name": varga_name,
+                "shlokas": results[job_indexes[0]][1]
+            })
+            continue
+        # Sub-vargas are converted numbering from 1; continue the numbering
+        # across them here
+        subVargas = []
+        prevCnt = 0
+        for index in job_indexes:
+            shlokas_json = results[index][1]
+            for item in shlokas_json:
+                item["num"] = str(int(item["num"]) + prevCnt)
+                subVargas.append(item)
+            prevCnt = len( shlokas_json ) + prevCnt
+        vargas.append({
+            "varga_id": str(varga_id),
+            "varga_name": varga_name,
+            "mangalam": mangalam_lines,
+            "shlokas": subVargas
+        })
+        # vargas.append( subVargas)
     return vargas
 
+# ------------------------------
+# Function to yield each kanda, in kanda_id order
+# ------------------------------
+def iter_kandas(data_folder, executor):
+    with os.scandir(data_folder) as it:
+        kandas = sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name)
+    # Order by kanda_id up front (stable, so ties keep name order), so each
+    # kanda can be handed on as soon as it is built
+    kandas.sort(key=lambda entry: entry.name.partition('_')[0])
+    for kanda in kandas:
+        kanda_name = kanda.name
+        kanda_path = kanda.path
+        # print(kanda_path)
+        kanda_id, _, kanda_display_name = kanda_name.partition('_')
+        mangalam_lines = read_mangalam(kanda_path)
+        vargas = extract_varga_data(kanda_path, executor)
+        yield {
+            "kanda_id": kanda_id,
+            "kanda_name": kanda_display_name,
+            "mangalam": mangalam_lines,
+            "vargas": vargas
+        }
+
 # ------------------------------
 # Main function to generate the full JSON
 # ------------------------------
 def generate_full_json(data_folder):
-    data = []
-    for kanda_name in sorted(os.listdir(data_folder)):
-        kanda_path = os.path.join(data_folder, kanda_name)
-        if os.path.isdir(kanda_path):
-            # print(kanda_path)
-            kanda_id = str(kanda_name.split('_')[0])
-            kanda_display_name = '_'.join(kanda_name.split('_')[1:])
-            mangalam_lines = read_mangalam(kanda_path)
-            vargas = extract_varga_data(kanda_path)
-            data.append({
-                "kanda_id": kanda_id,
-                "kanda_name": kanda_display_name,
-                "mangalam": mangalam_lines,
-                "vargas": vargas
-            })
-    return { "name": "आख्यातचन्द्रिका","data": sorted(data, key=lambda x: x["kanda_id"])}
+    # One pool of workers converts the files of every kanda
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        data = list(iter_kandas(data_folder, executor))
+    return { "name": BOOK_NAME,"data": data}
+
+# ------------------------------
+# Function to write the full JSON one kanda at a time, holding only one kanda in memory.
+# The text is the same as json.dumps of generate_full_json's result (indent=4, or
+# compact); it goes to a temporary file first, so a failed run keeps the old output
+# ------------------------------
+def write_full_json(data_folder, output_file, compact=False):
+    if compact:
+        head = '{"name":' + json.dumps(BOOK_NAME, ensure_ascii=False) + ',"data":['
+        first_separator, separator, tail, empty_tail = '', ',', ']}', ']}'
+    else:
+        head = '{\n    "name": ' + json.dumps(BOOK_NAME, ensure_ascii=False) + ',\n    "data": ['
+        first_separator, separator, tail, empty_tail = '\n        ', ',\n        ', '\n    ]\n}', ']\n}'
+
+    tmp_file = output_file + '.tmp'
+    try:
+        with open(tmp_file, 'wb') as f, \
+             ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            f.write(head.encode('utf-8'))
+            count = 0
+            for kanda in iter_kandas(data_folder, executor):
+                # orjson has no indent=4, so it only serves the compact form
+                if compact and orjson:
+                    encoded = orjson.dumps(kanda)
+                elif compact:
+                    encoded = json.dumps(kanda, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                else:
+                    # Each kanda sits two levels deep in the indented document
+                    text = json.dumps(kanda, ensure_ascii=False, indent=4)
+                    encoded = text.replace('\n', '\n        ').encode('utf-8')
+                f.write((separator if count else first_separator).encode('utf-8') + encoded)
+                count += 1
+            f.write((tail if count else empty_tail).encode('utf-8'))
+    except BaseException:
+        os.remove(tmp_file)
+        raise
+    os.replace(tmp_file, output_file)
 
 # ------------------------------
 # Script execution
 # ------------------------------
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python3 iterateDirectories.py ../Data output/AkhyataChandrika_Autogenerated.json  ")
+    args = sys.argv[1:]
+    # --compact writes the JSON without indentation: smaller and faster to
+    # write and parse, but the checked-in output stays pretty-printed
+    compact = '--compact' in args
+    if compact:
+        args.remove('--compact')
+
+    if len(args) != 2:
+        print("Usage: python3 iterateDirectories.py ../Data output/AkhyataChandrika_Autogenerated.json [--compact]")
         sys.exit(1)
 
-    data_folder = sys.argv[1]
-    output_file = sys.argv[2]
+    data_folder = args[0]
+    output_file = args[1]
 
     if not os.path.exists(data_folder):
         print(f"Error: {data_folder} does not exist")
         sys.exit(1)
 
-    full_json = generate_full_json(data_folder)
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(full_json, f, ensure_ascii=False, indent=4)
+    write_full_json(data_folder, output_file, compact)
+    prune_cache()
 
     print(f"✅ Full JSON written to {output_file}")
-
@@ -12,20 +12,14 @@ import yaml
 import json
 import os
 import sys
-from collections import OrderedDict
+import functools
+from collections import defaultdict
 
-# Custom YAML dumper to preserve strings and formatting
-class QuotedDumper(yaml.SafeDumper):
-    pass
+from _yaml_fast import DUMP_WIDTH, QuotedDumper, is_simple_key, quote_scalar
 
-def quoted_str_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
 
-def ordered_dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
-
-yaml.add_representer(str, quoted_str_representer, Dumper=QuotedDumper)
-yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=QuotedDumper)
+class _NotFormattable(Exception):
+    """Raised when data falls outside the shapes format_yaml writes itself"""
 
 
 def load_json_data(json_file):
@@ -34,11 +28,48 @@ def load_json_data(json_file):
         return json.load(f)
 
 
-def rebuild_yaml_from_json(json_data, kanda_name, varga_name, varga_id, adhikaar=None):
+@functools.lru_cache(maxsize=None)
+def clean_dhatu_id(dhatu_id):
+    """
+    Remove the " (More than one)" suffix from a dhatu_id. The same ids recur
+    across many entries, so results are cached, and interned so every list
+    holding an id shares one string.
+    """
+    return sys.intern(dhatu_id.replace(" (More than one)", ""))
+
+
+def intern(value):
+    """
+    Intern a string value. Artha and form values repeat across many entries;
+    interning lets the rebuilt dicts share one key string each. Anything
+    other than a string is returned as-is.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def entry_value(entry):
+    """
+    The YAML value for a JSON verb entry: [gati, dhatu_id], [dhatu_id], or
+    None when the dhatu_id was not found or is missing.
     """
-    Rebuild YAML structure from JSON data for a specific varga.
+    dhatu_id = entry.get('dhatu_id', '')
+    if dhatu_id == "Not Found":
+        # Keep as null
+        return None
+    gati = entry.get('gati', '')
+    if gati and gati.strip():
+        return [gati, clean_dhatu_id(dhatu_id)]
+    if dhatu_id:
+        return [clean_dhatu_id(dhatu_id)]
+    return None
+
+
+def rebuild_yaml_from_json(shlokas):
+    """
+    Rebuild YAML structure from the JSON shlokas of a varga (or of one
+    adhikaar of it).
 
-    Returns: OrderedDict with structure:
+    Returns: dict with structure:
     {
         "shloka text": {
             "artha": {
@@ -47,74 +78,38 @@ def rebuild_yaml_from_json(json_data, kanda_name, varga_name, varga_id, adhikaar
         }
     }
     """
-    yaml_data = OrderedDict()
-
-    # Find the kanda and varga in JSON
-    for kanda in json_data.get('data', []):
-        if kanda.get('kanda_name') != kanda_name:
-            continue
-
-        for varga in kanda.get('vargas', []):
-            if varga.get('varga_name') != varga_name or varga.get('varga_id') != varga_id:
-                continue
-
-            # Process each shloka
-            for shloka in varga.get('shlokas', []):
-                # Check if we should filter by adhikaar
-                shloka_adhikaar = shloka.get('adhikaar')
-                if adhikaar is not None and shloka_adhikaar != adhikaar:
-                    continue
-
-                shloka_text = shloka.get('text', '').strip()
-                # The shloka text already ends with ॥, so just add it as is
-                # Check if it already ends with ॥
-                if shloka_text.endswith('॥'):
-                    shloka_key = f"{shloka_text}"
-                else:
-                    shloka_key = f"{shloka_text} ॥"
-
-                # Build artha structure
-                artha_dict = OrderedDict()
+    yaml_data = {}
 
-                for verb_block in shloka.get('verbs', []):
-                    artha = verb_block.get('artha', '')
+    # Process each shloka
+    for shloka in shlokas:
+        shloka_text = shloka.get('text', '').strip()
+        # The shloka text already ends with ॥, so just add it as is
+        shloka_key = shloka_text if shloka_text.endswith('॥') else shloka_text + ' ॥'
 
-                    # Build verb entries for this artha
-                    verb_entries = OrderedDict()
+        # Build artha structure
+        artha_dict = {}
 
-                    for entry in verb_block.get('entries', []):
-                        form = entry.get('form', '')
-                        dhatu_id = entry.get('dhatu_id', '')
-                        gati = entry.get('gati', '')
+        for verb_block in shloka.get('verbs', []):
+            artha = intern(verb_block.get('artha', ''))
 
-                        # Create the value based on what we have
-                        if dhatu_id == "Not Found":
-                            # Keep as null
-                            verb_entries[form] = None
-                        elif gati and gati.strip():
-                            # Remove " (More than one)" suffix if present
-                            dhatu_clean = dhatu_id.replace(" (More than one)", "")
-                            verb_entries[form] = [gati, dhatu_clean]
-                        elif dhatu_id:
-                            # Remove " (More than one)" suffix if present
-                            dhatu_clean = dhatu_id.replace(" (More than one)", "")
-                            verb_entries[form] = [dhatu_clean]
-                        else:
-                            verb_entries[form] = None
+            # Build verb entries for this artha
+            verb_entries = {}
 
-                    artha_dict[artha] = verb_entries
+            for entry in verb_block.get('entries', []):
+                form = intern(entry.get('form', ''))
+                verb_entries[form] = entry_value(entry)
 
-                yaml_data[shloka_key] = artha_dict
+            artha_dict[artha] = verb_entries
 
-            break
-        break
+        yaml_data[shloka_key] = artha_dict
 
     return yaml_data
 
 
-def rebuild_yaml_from_json_nanartha(json_data, kanda_name, varga_name, adhikaar):
+def rebuild_yaml_from_json_nanartha(shlokas):
     """
-    Rebuild YAML structure from JSON data for Nanartha Varga.
+    Rebuild YAML structure from the JSON shlokas of one adhikaar of
+    Nanartha Varga.
 
     In Nanartha Varga, the YAML structure is special:
     - Shloka line has ": null"
@@ -131,84 +126,122 @@ def rebuild_yaml_from_json_nanartha(json_data, kanda_name, varga_name, adhikaar)
         - "प्र"
         - "01.0001"
     """
-    yaml_data = OrderedDict()
+    yaml_data = {}
 
-    # Find the kanda and varga in JSON
-    for kanda in json_data.get('data', []):
-        if kanda.get('kanda_name') != kanda_name:
-            continue
+    # Group shlokas by shloka text
+    shloka_groups = defaultdict(list)
 
-        for varga in kanda.get('vargas', []):
-            if varga.get('varga_name') != varga_name:
-                continue
+    for shloka in shlokas:
+        shloka_text = shloka.get('text', '').strip()
+        shloka_groups[shloka_text].append(shloka)
 
-            # Group shlokas by shloka text
-            shloka_groups = OrderedDict()
-
-            for shloka in varga.get('shlokas', []):
-                # Check if this shloka belongs to the specific adhikaar
-                shloka_adhikaar = shloka.get('adhikaar')
-                if shloka_adhikaar != adhikaar:
-                    continue
+    # Process each shloka group
+    for shloka_text, group in shloka_groups.items():
+        # Add shloka line with null value
+        # The shloka text already ends with ॥
+        shloka_key = shloka_text if shloka_text.endswith('॥') else shloka_text + ' ॥'
+        yaml_data[shloka_key] = None
 
-                shloka_text = shloka.get('text', '').strip()
+        # Collect all verbs for this shloka
+        form_dict = defaultdict(list)
 
-                if shloka_text not in shloka_groups:
-                    shloka_groups[shloka_text] = []
+        for shloka in group:
+            for verb_block in shloka.get('verbs', []):
+                artha = intern(verb_block.get('artha', ''))
 
-                shloka_groups[shloka_text].append(shloka)
+                for entry in verb_block.get('entries', []):
+                    form = intern(entry.get('form', ''))
+                    # Create artha entry as a dict
+                    form_dict[form].append({artha: entry_value(entry)})
 
-            # Process each shloka group
-            for shloka_text, shlokas in shloka_groups.items():
-                # Add shloka line with null value
-                # The shloka text already ends with ॥
-                if shloka_text.endswith('॥'):
-                    shloka_key = f"{shloka_text}"
-                else:
-                    shloka_key = f"{shloka_text} ॥"
-                yaml_data[shloka_key] = None
-
-                # Collect all verbs for this shloka
-                form_dict = OrderedDict()
-
-                for shloka in shlokas:
-                    for verb_block in shloka.get('verbs', []):
-                        artha = verb_block.get('artha', '')
-
-                        for entry in verb_block.get('entries', []):
-                            form = entry.get('form', '')
-                            dhatu_id = entry.get('dhatu_id', '')
-                            gati = entry.get('gati', '')
-
-                            # Initialize form entry if not exists
-                            if form not in form_dict:
-                                form_dict[form] = []
-
-                            # Create artha entry as a dict
-                            if dhatu_id == "Not Found":
-                                form_dict[form].append({artha: None})
-                            elif gati and gati.strip():
-                                dhatu_clean = dhatu_id.replace(" (More than one)", "")
-                                form_dict[form].append({artha: [gati, dhatu_clean]})
-                            elif dhatu_id:
-                                dhatu_clean = dhatu_id.replace(" (More than one)", "")
-                                form_dict[form].append({artha: [dhatu_clean]})
-                            else:
-                                form_dict[form].append({artha: None})
-
-                # Add all verb forms at root level
-                for form, artha_list in form_dict.items():
-                    yaml_data[form] = artha_list
-
-            break
-        break
+        # Add all verb forms at root level
+        for form, artha_list in form_dict.items():
+            yaml_data[form] = artha_list
 
     return yaml_data
 
 
+def _quote_key(key):
+    if not is_simple_key(key):
+        raise _NotFormattable
+    return quote_scalar(key)
+
+
+def _format_value(prefix, value, lines):
+    """Append a null, string or empty value, or raise _NotFormattable"""
+    if value is None:
+        lines.append(prefix + 'null\n')
+    elif type(value) is dict and not value:
+        lines.append(prefix + '{}\n')
+    elif type(value) is list and not value:
+        lines.append(prefix + '[]\n')
+    elif type(value) is str:
+        line = prefix + quote_scalar(value) + '\n'
+        if len(line) > DUMP_WIDTH:
+            raise _NotFormattable
+        lines.append(line)
+    else:
+        raise _NotFormattable
+
+
+def _format_mapping(mapping, indent, first_prefix, lines):
+    """
+    Append a block mapping whose keys sit at indent. The first key follows
+    first_prefix instead (the "- " of a sequence item).
+    """
+    prefix = first_prefix
+    for key, value in mapping.items():
+        key_text = prefix + _quote_key(key) + ':'
+        prefix = ' ' * indent
+        if type(value) is dict and value:
+            lines.append(key_text + '\n')
+            _format_mapping(value, indent + 2, ' ' * (indent + 2), lines)
+        elif type(value) is list and value:
+            # Sequences in a mapping are not indented past their key
+            lines.append(key_text + '\n')
+            _format_sequence(value, indent, lines)
+        else:
+            _format_value(key_text + ' ', value, lines)
+
+
+def _format_sequence(sequence, indent, lines):
+    for item in sequence:
+        if type(item) is dict and item:
+            _format_mapping(item, indent + 2, ' ' * indent + '- ', lines)
+        else:
+            _format_value(' ' * indent + '- ', item, lines)
+
+
+def format_yaml(data):
+    """
+    Format rebuilt YAML data exactly as yaml.dump with QuotedDumper would.
+
+    This skips the generic emitter for the fixed shapes the rebuild
+    functions produce: nested mappings of string keys ending in null,
+    string, empty, or lists of strings and single-artha mappings.
+
+    Returns: The YAML text, or None if the data does not fit those shapes
+    (the caller then falls back to yaml.dump)
+    """
+    if type(data) is not dict or not data:
+        return None
+
+    lines = []
+    try:
+        _format_mapping(data, 0, '', lines)
+    except _NotFormattable:
+        return None
+    return ''.join(lines)
+
+
 def write_yaml_file(yaml_file, data):
     """Write YAML data to file with proper formatting"""
+    text = format_yaml(data)
     with open(yaml_file, 'w', encoding='utf-8') as f:
+        if text is not None:
+            f.write(text)
+            return
+
         yaml.dump(
             data,
             f,
@@ -216,7 +249,7 @@ def write_yaml_file(yaml_file, data):
             default_flow_style=False,
             indent=2,
             sort_keys=False,
-            width=1000,
+            width=DUMP_WIDTH,
             Dumper=QuotedDumper
         )
 
@@ -268,12 +301,13 @@ def process_all_yaml_files(data_folder, json_file):
 
                 print(f"\n📂 Processing Varga with sub-sections: {varga_name}")
 
-                # Get all unique adhikaars from shlokas
-                adhikaars = set()
+                # Group the shlokas by adhikaar in one pass, so each
+                # adhikaar's file is rebuilt from its own shlokas only
+                shlokas_by_adhikaar = defaultdict(list)
                 for shloka in varga.get('shlokas', []):
                     adhikaar = shloka.get('adhikaar')
                     if adhikaar:
-                        adhikaars.add(adhikaar)
+                        shlokas_by_adhikaar[adhikaar].append(shloka)
 
                 # Map adhikaar names to file numbers
                 adhikaar_to_file = {
@@ -292,7 +326,7 @@ def process_all_yaml_files(data_folder, json_file):
                 }
 
                 # Process each adhikaar
-                for adhikaar in sorted(adhikaars):
+                for adhikaar in sorted(shlokas_by_adhikaar):
                     if adhikaar not in adhikaar_to_file:
                         print(f"  ⚠️  Unknown adhikaar: {adhikaar}")
                         continue
@@ -306,9 +340,7 @@ def process_all_yaml_files(data_folder, json_file):
 
                     print(f"\n  📝 Rebuilding: {yaml_file}")
 
-                    yaml_data = rebuild_yaml_from_json(
-                        json_data, kanda_name, varga_name, varga_id, adhikaar
-                    )
+                    yaml_data = rebuild_yaml_from_json(shlokas_by_adhikaar[adhikaar])
 
                     if yaml_data:
                         write_yaml_file(yaml_file, yaml_data)
@@ -328,9 +360,7 @@ def process_all_yaml_files(data_folder, json_file):
                 print(f"\n📂 Processing Varga: {varga_name}")
                 print(f"📝 Rebuilding: {yaml_file}")
 
-                yaml_data = rebuild_yaml_from_json(
-                    json_data, kanda_name, varga_name, varga_id, adhikaar=None
-                )
+                yaml_data = rebuild_yaml_from_json(varga.get('shlokas', []))
 
                 if yaml_data:
                     write_yaml_file(yaml_file, yaml_data)
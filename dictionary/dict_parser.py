@@ -1,7 +1,15 @@
 import os
 import gzip
+import mmap
 import struct
 import json
+import contextlib
+
+# Serialize with orjson when available (same output as json.dump below)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # -----------------------------
 # CONFIG: Set your dictionary folder path here
@@ -24,38 +32,35 @@ def read_ifo(ifo_path):
                 meta[key.strip()] = val.strip()
     return meta
 
+def _map_file(f):
+    """Map an open binary file read-only (empty files cannot be mapped)"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
 def read_idx(idx_path):
     """Read .idx file and return {word: (offset, size)}"""
     idx = {}
-    with open(idx_path, "rb") as f:
+    with open(idx_path, "rb") as f, _map_file(f) as data:
+        pos = 0
         while True:
-            # Read null-terminated word
-            word_bytes = bytearray()
-            while True:
-                b = f.read(1)
-                if not b:
-                    return idx
-                if b == b'\x00':
-                    break
-                word_bytes += b
-            word = word_bytes.decode('utf-8')
+            # Find the null terminator of the word in one scan
+            end = data.find(b'\x00', pos)
+            if end == -1 or end + 9 > len(data):
+                return idx
+            word = data[pos:end].decode('utf-8')
             # Read 4 bytes offset + 4 bytes size (big-endian)
-            offset_bytes = f.read(4)
-            size_bytes = f.read(4)
-            if not offset_bytes or not size_bytes:
-                break
-            offset = struct.unpack('>I', offset_bytes)[0]
-            size = struct.unpack('>I', size_bytes)[0]
-            idx[word] = (offset, size)
+            idx[word] = struct.unpack_from('>II', data, end + 1)
+            pos = end + 9
 
 def read_dict(dict_path):
     """Read dict.dz (gzipped) or dict file"""
+    with open(dict_path, 'rb') as f:
+        data = f.read()
     if dict_path.endswith(".dz"):
-        with gzip.open(dict_path, 'rb') as f:
-            data = f.read()
-    else:
-        with open(dict_path, 'rb') as f:
-            data = f.read()
+        # Decompress the whole buffer in one call instead of streaming
+        # through a GzipFile reader
+        data = gzip.decompress(data)
     return data
 
 def read_syn(syn_path):
@@ -63,33 +68,42 @@ def read_syn(syn_path):
     syn_map = {}
     if not syn_path or not os.path.exists(syn_path):
         return syn_map
-    with open(syn_path, 'rb') as f:
+    with open(syn_path, 'rb') as f, _map_file(f) as data:
+        pos = 0
         while True:
-            # Read null-terminated synonym word
-            word_bytes = bytearray()
-            while True:
-                b = f.read(1)
-                if not b:
-                    return syn_map
-                if b == b'\x00':
-                    break
-                word_bytes += b
-            if not word_bytes:
+            # Find the null terminator of the synonym word in one scan
+            end = data.find(b'\x00', pos)
+            if end == -1:
+                return syn_map
+            if end == pos:
+                pos += 1
                 continue
             # Decode using latin1 to avoid decode errors
-            syn_word = word_bytes.decode('latin1')
+            syn_word = data[pos:end].decode('latin1')
 
             # Read 4-byte offset + 4-byte size (big-endian)
-            offset_bytes = f.read(4)
-            size_bytes = f.read(4)
-            if not offset_bytes or not size_bytes:
+            if end + 9 > len(data):
                 break
-            offset = struct.unpack('>I', offset_bytes)[0]
-            size = struct.unpack('>I', size_bytes)[0]
-
-            syn_map[syn_word] = (offset, size)
+            syn_map[syn_word] = struct.unpack_from('>II', data, end + 1)
+            pos = end + 9
     return syn_map
 
+def parse_entry(dict_view, offset, size):
+    """Decode one dict entry into its artha, text number and synonyms"""
+    entry = dict_view[offset:offset+size]
+    try:
+        meaning = str(entry, 'utf-8')
+    except UnicodeDecodeError:
+        meaning = str(entry, 'latin1', errors='replace')
+    # Only the first three lines are used
+    entities = meaning.split('\n', 3)
+
+    return {
+        "artha": entities[0],
+        "text_number":entities[1],
+        "synonyms": entities[2].split(' ')
+    }
+
 def version_key(vstr):
     """
     Convert a version string like '1.1.2' to a tuple of ints for sorting.
@@ -98,6 +112,11 @@ def version_key(vstr):
     if not isinstance(vstr, str):
         return (0, 0, 0)
     parts = vstr.split(".")
+    # Well-formed versions convert in one pass; fall back per part otherwise
+    try:
+        return tuple(map(int, parts))
+    except ValueError:
+        pass
     version_nums = []
     for part in parts:
         try:
@@ -137,34 +156,24 @@ idx = read_idx(idx_file)
 dict_data = read_dict(dict_file)
 syn_map = read_syn(syn_file)
 
-# Build JSON entries
-json_entries = {}
+# Build JSON entries for the main words, decoded straight from a view of the
+# dict data (no slice copies)
+dict_view = memoryview(dict_data)
+json_entries = {word: parse_entry(dict_view, offset, size)
+                for word, (offset, size) in idx.items()}
 
-# Main words
-for word, (offset, size) in idx.items():
-    try:
-        meaning = dict_data[offset:offset+size].decode('utf-8')
-    except UnicodeDecodeError:
-        meaning = dict_data[offset:offset+size].decode('latin1', errors='replace')
-    entities = meaning.split('\n')
-    
-    json_entries[word] = {
-        "artha": entities[0],
-        "text_number":entities[1],
-        "synonyms": entities[2].split(' ')
-    }
+# Map offset+size back to the first main word that uses it
+word_by_location = {}
+for word, location in idx.items():
+    word_by_location.setdefault(location, word)
 
 # Add synonyms
-for syn_word, (offset, size) in syn_map.items():
-    # Try to find main word by matching offset+size
-    main_word = None
-    for w, (o, s) in idx.items():
-        if o == offset and s == size:
-            main_word = w
-            break
+for syn_word, location in syn_map.items():
+    main_word = word_by_location.get(location)
     if main_word:
         json_entries[syn_word] = {
-            "meaning": json_entries[main_word]["meaning"],
+            "artha": json_entries[main_word]["artha"],
+            "text_number": json_entries[main_word]["text_number"],
             "synonyms": [main_word]
         }
 
@@ -183,7 +192,11 @@ final_json = {
 }
 
 # Save to JSON file
-with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
-    json.dump(final_json, f, ensure_ascii=False, indent=2)
+if orjson:
+    with open(OUTPUT_JSON, "wb") as f:
+        f.write(orjson.dumps(final_json, option=orjson.OPT_INDENT_2))
+else:
+    with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
+        json.dump(final_json, f, ensure_ascii=False, indent=2)
 
 print(f"✅ Dictionary converted to JSON: {OUTPUT_JSON}")
@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 import json
 import os
-import re
-from typing import Any, Dict, List, Tuple
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# Stream the input entries with ijson when available, instead of loading
+# the whole file before the first entry is processed
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 
 SPEC_INPUT_PATH = os.path.join(
@@ -14,110 +21,118 @@ INVALID_FILE = os.path.join(INVALID_DIR, "invalid.text_numbers.json")
 INVALID_YAML_FILE = os.path.join(INVALID_DIR, "invalid.text_numbers.yaml")
 
 
-TEXT_NUMBER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+# Directories already created by this run; the output files of one
+# khanda share a directory, so each is only made once
+_ensured_dirs: Set[str] = set()
 
 
 def ensure_directories(path: str) -> None:
+    if path in _ensured_dirs:
+        return
     os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
 
 
 def parse_text_number(text_number: str) -> Tuple[int, int, int]:
-    match = TEXT_NUMBER_RE.match(text_number.strip())
-    if not match:
+    # x.y.z: three runs of decimal digits (as re's \d, any Unicode digit)
+    parts = text_number.strip().split(".")
+    if len(parts) != 3:
+        raise ValueError("malformed text_number")
+    x_str, y_str, z_str = parts
+    if not (x_str.isdecimal() and y_str.isdecimal() and z_str.isdecimal()):
         raise ValueError("malformed text_number")
-    x_str, y_str, z_str = match.groups()
     return int(x_str), int(y_str), int(z_str)
 
 
-def read_input(path: str) -> List[Tuple[str, Dict[str, Any]]]:
-    with open(path, "r", encoding="utf-8") as f:
-        payload = json.load(f)
-    # Expecting payload with key "entries": list of [headword, data]
-    entries = payload.get("entries", [])
-    result: List[Tuple[str, Dict[str, Any]]] = []
-    for item in entries:
-        if isinstance(item, list) and len(item) == 2 and isinstance(item[1], dict):
-            result.append((item[0], item[1]))
-    return result
-
+def iter_entries(path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    with open(path, "rb") as f:
+        # Expecting payload with key "entries": list of [headword, data]
+        if ijson is not None:
+            # use_float keeps non-integer numbers as floats, as json.load
+            # does, so invalid items are dumped back unchanged
+            entries = ijson.items(f, "entries.item", use_float=True)
+        else:
+            entries = json.loads(f.read().decode("utf-8")).get("entries", [])
+        for item in entries:
+            if isinstance(item, list) and len(item) == 2 and isinstance(item[1], dict):
+                yield item[0], item[1]
 
-def write_invalid_json(item: Tuple[str, Dict[str, Any]]) -> None:
-    ensure_directories(INVALID_DIR)
-    with open(INVALID_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(item, ensure_ascii=False))
-        f.write("\n")
 
-
-def append_invalid_yaml(artha: str, synonyms: List[str]) -> None:
-    # Only append if we have a sensible artha and a list of string synonyms
-    if not isinstance(artha, str) or not isinstance(synonyms, list):
-        return
-    if not all(isinstance(s, str) and s.strip() for s in synonyms):
+def write_invalid_json(items: List[Tuple[str, Dict[str, Any]]]) -> None:
+    if not items:
         return
     ensure_directories(INVALID_DIR)
-    # Reuse the same YAML block format
-    lines: List[str] = [f"{artha}:"]
-    for syn in synonyms:
-        lines.append(f"  - {syn}:")
-    block = "\n".join(lines) + "\n"
-    if os.path.exists(INVALID_YAML_FILE) and os.path.getsize(INVALID_YAML_FILE) > 0:
-        with open(INVALID_YAML_FILE, "a", encoding="utf-8") as f:
+    with open(INVALID_FILE, "a", encoding="utf-8") as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False))
             f.write("\n")
-            f.write(block)
-    else:
-        with open(INVALID_YAML_FILE, "w", encoding="utf-8") as f:
-            f.write(block)
 
 
-def append_yaml_block(file_path: str, artha: str, synonyms: List[str]) -> None:
-    ensure_directories(os.path.dirname(file_path))
+def yaml_block(artha: str, synonyms: List[str]) -> Optional[str]:
     # Prepare YAML block with required format:
     # artha:\n  - synonym1:\n  - synonym2:\n
     # Normalize lines to avoid trailing spaces; keep exactly two-space indent for list items
-    lines: List[str] = [f"{artha}:"]
+    lines: List[str] = [f"{artha}:\n"]
     for syn in synonyms:
-        lines.append(f"  - {syn}:")
-    block = "\n".join(lines) + "\n"
+        # Reject non-string or blank synonyms to avoid broken YAML lines
+        if not isinstance(syn, str) or not syn.strip():
+            return None
+        lines.append(f"  - {syn}:\n")
+    return "".join(lines)
 
-    # Append with a separating newline if file already has content
+
+def append_yaml_blocks(file_path: str, blocks: List[str]) -> None:
+    ensure_directories(os.path.dirname(file_path))
+    # Blocks are separated by a newline, as is the first one from any
+    # content the file already has
+    text = "\n".join(blocks)
     if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
         with open(file_path, "a", encoding="utf-8") as f:
             f.write("\n")
-            f.write(block)
+            f.write(text)
     else:
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(block)
+            f.write(text)
 
 
 def process() -> None:
-    entries = read_input(SPEC_INPUT_PATH)
+    # Collect the blocks for each output file, and the invalid items, so
+    # each file is opened once after the loop rather than once per entry
+    blocks_by_file: Dict[str, List[str]] = defaultdict(list)
+    invalid_items: List[Tuple[str, Dict[str, Any]]] = []
 
-    for headword, data in entries:
+    for headword, data in iter_entries(SPEC_INPUT_PATH):
         text_number = data.get("text_number", "")
         artha = data.get("artha", "").strip()
         synonyms = data.get("synonyms", [])
 
         # Basic validation of required fields
         if not isinstance(text_number, str) or not isinstance(artha, str) or not isinstance(synonyms, list):
-            write_invalid_json((headword, data))
+            invalid_items.append((headword, data))
             continue
 
-        # Reject non-string synonyms early to avoid broken YAML lines
-        if not all(isinstance(s, str) and s.strip() for s in synonyms):
-            write_invalid_json((headword, data))
+        # The block is built and its synonyms checked in one pass; None
+        # means a synonym would have broken the YAML
+        block = yaml_block(artha, synonyms)
+        if block is None:
+            invalid_items.append((headword, data))
             continue
 
         try:
             x, y, _z = parse_text_number(text_number)
         except Exception:
             # Log all invalids to JSON, and also append to invalid YAML using the same format
-            write_invalid_json((headword, data))
-            append_invalid_yaml(artha, synonyms)
+            invalid_items.append((headword, data))
+            blocks_by_file[INVALID_YAML_FILE].append(block)
             continue
 
         out_dir = os.path.join(OUTPUT_ROOT, str(x))
         out_file = os.path.join(out_dir, f"{y}.yaml")
-        append_yaml_block(out_file, artha, synonyms)
+        blocks_by_file[out_file].append(block)
+
+    write_invalid_json(invalid_items)
+    for file_path, blocks in blocks_by_file.items():
+        append_yaml_blocks(file_path, blocks)
 
 
 if __name__ == "__main__":